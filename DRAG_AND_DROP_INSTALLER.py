@@ -9,23 +9,92 @@ import shutil
 import stat
 import traceback
 import time
+from multiprocessing.pool import ThreadPool
 import maya.cmds as cmds
 
 
+# Larger buffer for shutil's copy when it can't use the OS's own fast copy.
+COPY_BUFSIZE = 1024 * 1024
+
+
+def _copy_tree_threaded(source_path, tool_path, max_workers=8):
+    """
+    Mirrors the folder structure, then copies its files across a pool of threads.
+    Copying lots of small files is mostly spent waiting on IO so overlapping them is faster.
+    """
+    dir_pairs = []
+    file_pairs = []
+
+    for root, dirs, files in os.walk(source_path):
+        dst_root = os.path.normpath(os.path.join(tool_path, os.path.relpath(root, source_path)))
+        os.makedirs(dst_root)
+        dir_pairs.append((root, dst_root))
+
+        for name in files:
+            file_pairs.append((os.path.join(root, name), os.path.join(dst_root, name)))
+
+    pool = ThreadPool(max_workers)
+
+    try:
+        pool.map(lambda pair: shutil.copy2(*pair), file_pairs)
+    finally:
+        pool.close()
+        pool.join()
+
+    # Match copytree by carrying over folder stats once their contents are in.
+    for src_dir, dst_dir in reversed(dir_pairs):
+        shutil.copystat(src_dir, dst_dir)
+
+
+def _copy_tree(source_path, tool_path, retry=False):
+    """
+    Copies the tool over, optionally retrying with a short backoff if it fails.
+    Windows may throw an 'access denied' exception doing a copytree right after a rmtree.
+    """
+    attempts = 10 if retry else 1
+    delay = 0.01
+
+    # Only exists in Python 3.8+, where copy2 also uses the platform's zero-copy calls.
+    old_bufsize = getattr(shutil, "COPY_BUFSIZE", None)
+    if old_bufsize is not None:
+        shutil.COPY_BUFSIZE = max(old_bufsize, COPY_BUFSIZE)
+
+    try:
+        for attempt in range(attempts):
+            try:
+                _copy_tree_threaded(source_path, tool_path)
+                return
+            except (IOError, OSError, shutil.Error):
+                if attempt == attempts - 1:
+                    raise
+
+                # Clear out anything partially copied before trying again.
+                shutil.rmtree(tool_path, ignore_errors=True)
+                time.sleep(delay)
+                delay = min(delay * 2, 0.5)
+    finally:
+        if old_bufsize is not None:
+            shutil.COPY_BUFSIZE = old_bufsize
+
+
 def onMayaDroppedPythonFile(*args):
+    normpath = os.path.normpath
+    join = os.path.join
+    dirname = os.path.dirname
+
     try:
         package_name = "weights_editor_tool"
-        source_dir = os.path.dirname(__file__)
-        source_path = os.path.normpath(os.path.join(source_dir, "scripts", package_name))
+        source_dir = dirname(__file__)
+        source_path = normpath(join(source_dir, "scripts", package_name))
         
         # Make sure this installer is relative to the main tool.
-        relative_path = os.path.join(source_path, "weights_editor.py")
-        if not os.path.exists(relative_path):
+        relative_path = join(source_path, "weights_editor.py")
+        if not os.path.lexists(relative_path):
             raise RuntimeError("Unable to find 'scripts/weights_editor.py' relative to this installer file.")
 
         # Suggest to install in user's script preferences.
-        prefs_dir = os.path.dirname(cmds.about(preferences=True))
-        scripts_dir = os.path.normpath(os.path.join(prefs_dir, "scripts"))
+        prefs_dir = dirname(cmds.about(preferences=True))
+        scripts_dir = normpath(join(prefs_dir, "scripts"))
 
         continue_option = "Continue"
         manual_option = "No, let me choose"
@@ -34,7 +103,7 @@ def onMayaDroppedPythonFile(*args):
         dialog = cmds.confirmDialog(
             message=(
                 "The weights editor tool will be installed in a new folder here:<br>"
-                "<i>{}</i>".format(os.path.normpath(os.path.join(scripts_dir, package_name)))),
+                "<i>{}</i>".format(normpath(join(scripts_dir, package_name)))),
             title="Installation path", icon="warning",
             button=[continue_option, manual_option, cancel_option],
             cancelButton=cancel_option, dismissString=cancel_option)
@@ -58,10 +127,10 @@ def onMayaDroppedPythonFile(*args):
             if not results:
                 return
             
-            install_path = os.path.normpath(results[0])
+            install_path = normpath(results[0])
         
         # Check if install path is in Python's path.
-        python_paths = [os.path.normpath(path) for path in sys.path]
+        python_paths = set(normpath(path) for path in sys.path)
         if install_path not in python_paths:
             cancel_option = "Cancel"
 
@@ -80,8 +149,10 @@ def onMayaDroppedPythonFile(*args):
                 return
 
         # If it already exists, asks if it's ok to overwrite.
-        tool_path = os.path.join(install_path, package_name)
-        if os.path.exists(tool_path):
+        tool_path = join(install_path, package_name)
+        tool_removed = False
+        # lexists follows the filesystem's own case rules and also catches broken links.
+        if os.path.lexists(tool_path):
             dialog = cmds.confirmDialog(
                 message=(
                     "This folder already exists:<br>"
@@ -97,16 +168,13 @@ def onMayaDroppedPythonFile(*args):
             # May need to tweak permissions before deleting.
             for root, dirs, files in os.walk(tool_path, topdown=False):
                 for name in files + dirs:
-                    os.chmod(os.path.join(root, name), stat.S_IWUSR)
+                    os.chmod(join(root, name), stat.S_IWUSR)
 
             shutil.rmtree(tool_path)
-        
-        # Windows may throw an 'access denied' exception doing a copytree right after a rmtree.
-        # Forcing it a slight delay seems to solve it.
-        time.sleep(1)
+            tool_removed = True
         
         # Copy tool's directory over.
-        shutil.copytree(source_path, tool_path)
+        _copy_tree(source_path, tool_path, retry=tool_removed and os.name == "nt")
 
         # Display success!
         cmds.confirmDialog(
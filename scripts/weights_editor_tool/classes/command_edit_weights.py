@@ -1,8 +1,7 @@
-import copy
-
 from maya import cmds
 from PySide2 import QtWidgets
 
+from weights_editor_tool.classes.skin_data import SkinData
 from weights_editor_tool.widgets import weights_table_view
 
 
@@ -28,11 +27,28 @@ class CommandEditWeights(QtWidgets.QUndoCommand):
         self._editor_cls = editor_cls
         self._skip_first_redo = skip_first_redo
         self._obj = obj
-        self._old_skin_data = old_skin_data
-        self._new_skin_data = new_skin_data
-        self._vert_indexes = vert_indexes
         self._table_selection = table_selection
 
+        # Only keep verts that actually changed so redo/undo skip the rest.
+        self._vert_indexes = [
+            vert_index
+            for vert_index in vert_indexes
+            if old_skin_data[vert_index] != new_skin_data[vert_index]]
+
+        # {vert_index: vert_data}
+        self._old_skin_data = {
+            vert_index: old_skin_data[vert_index]
+            for vert_index in self._vert_indexes}
+
+        self._new_skin_data = {
+            vert_index: new_skin_data[vert_index]
+            for vert_index in self._vert_indexes}
+
+        # Displayed influences only need to be re-collected if a vert gained or lost one.
+        self._infs_changed = any(
+            set(self._old_skin_data[vert_index]["weights"]) != set(self._new_skin_data[vert_index]["weights"])
+            for vert_index in self._vert_indexes)
+
     def _edit_weights(self, skin_data):
         if not self._obj or not cmds.objExists(self._obj):
             return
@@ -41,17 +57,25 @@ class CommandEditWeights(QtWidgets.QUndoCommand):
         old_column_count = weights_view.horizontalHeader().count()
         weights_view.begin_update()
 
-        self._editor_cls.instance.obj.skin_data = copy.deepcopy(skin_data)
-        self._editor_cls.instance.obj.apply_current_skin_weights(self._vert_indexes, normalize=True)
-        self._editor_cls.instance.update_vert_colors(vert_filter=self._vert_indexes)
-        self._editor_cls.instance.collect_display_infs()
+        for vert_index, vert_data in skin_data.items():
+            self._editor_cls.instance.obj.skin_data[vert_index] = SkinData.copy_vertex_data(vert_data)
+
+        # An empty vert filter would refresh every vert, so skip it if nothing changed.
+        if self._vert_indexes:
+            self._editor_cls.instance.obj.apply_current_skin_weights(self._vert_indexes, normalize=True)
+            self._editor_cls.instance.update_vert_colors(vert_filter=self._vert_indexes)
+
+        if self._infs_changed:
+            self._editor_cls.instance.collect_display_infs()
 
         weights_view.load_table_selection(self._table_selection)
-        weights_view.color_headers()
+
+        if self._infs_changed:
+            weights_view.color_headers()
 
         weights_view.end_update()
 
-        if isinstance(weights_view, weights_table_view.TableView) and \
+        if self._infs_changed and isinstance(weights_view, weights_table_view.TableView) and \
                 weights_view.horizontalHeader().count() != old_column_count:
             weights_view.fit_headers_to_contents()
 
@@ -1,4 +1,5 @@
 from maya import cmds
+from maya.api import OpenMaya as om2
 
 from PySide2 import QtWidgets
 
@@ -19,21 +20,54 @@ class CommandLockInfs(QtWidgets.QUndoCommand):
 
         self._editor_cls = editor_cls
 
-        # {inf_name, default_lock_state}
-        self._infs = {
-            inf: cmds.getAttr("{0}.lockInfluenceWeights".format(inf))
-            for inf in infs}
+        # The editor already tracks locks, so only query ones it doesn't know about.
+        locks = editor_cls.instance.locks
+        inf_indexes = editor_cls.instance.obj.inf_indexes
+
+        # {inf_name: (node_handle, default_lock_state)}
+        self._infs = {}
+
+        for inf in infs:
+            inf_index = inf_indexes.get(inf)
+            if inf_index is not None and inf_index < len(locks):
+                lock = locks[inf_index]
+            else:
+                lock = cmds.getAttr("{0}.lockInfluenceWeights".format(inf))
+
+            self._infs[inf] = (self._get_node_handle(inf), lock)
 
         self._enabled = enabled
 
+    @staticmethod
+    def _get_node_handle(node):
+        """
+        Resolves the node once so undo/redo doesn't need to look it up by name again.
+        """
+        msel_list = om2.MSelectionList()
+
+        try:
+            msel_list.add(node)
+        except RuntimeError:
+            return None
+
+        return om2.MObjectHandle(msel_list.getDependNode(0))
+
     def lock_infs(self, use_redo_value):
         weights_view = self._editor_cls.instance.get_active_weights_view()
 
         weights_view.begin_update()
         self._editor_cls.instance.inf_list.begin_update()
 
-        for inf, enabled in self._infs.items():
-            if not cmds.objExists(inf) or inf not in self._editor_cls.instance.obj.infs:
+        # Influences can change between undos, so use the object's current mapping.
+        inf_indexes = self._editor_cls.instance.obj.inf_indexes
+        locks = self._editor_cls.instance.locks
+
+        # Set all plugs in one pass instead of going through setAttr per influence.
+        modifier = om2.MDGModifier()
+
+        for inf, (node_handle, enabled) in self._infs.items():
+            inf_index = inf_indexes.get(inf)
+            if inf_index is None or node_handle is None or not node_handle.isValid():
                 continue
 
             if use_redo_value:
@@ -41,11 +75,16 @@ class CommandLockInfs(QtWidgets.QUndoCommand):
             else:
                 lock = enabled
 
-            cmds.setAttr("{0}.lockInfluenceWeights".format(inf), lock)
+            mfn_node = om2.MFnDependencyNode(node_handle.object())
+            plug = mfn_node.findPlug("lockInfluenceWeights", False)
+            modifier.newPlugValueBool(plug, lock)
+
+            locks[inf_index] = lock
 
-            inf_index = self._editor_cls.instance.obj.infs.index(inf)
+        modifier.doIt()
 
-            self._editor_cls.instance.locks[inf_index] = lock
+        if self._editor_cls.instance.obj.is_skin_data_loaded():
+            self._editor_cls.instance.obj.skin_data.clear_lock_cache()
 
         self._editor_cls.instance.inf_list.end_update()
         weights_view.end_update()
@@ -4,7 +4,9 @@ from PySide2 import QtGui
 from weights_editor_tool.enums import Hotkeys
 
 
-class Hotkey:
+class Hotkey(object):
+
+    __slots__ = ("caption", "key", "func", "ctrl", "shift", "alt")
 
     Defaults = {
         Hotkeys.ToggleTableListViews: {"key": QtCore.Qt.Key_QuoteLeft, "ctrl": True},
@@ -31,6 +33,12 @@ class Hotkey:
         Hotkeys.ToggleInfLock2: {"key": QtCore.Qt.Key_L}
     }
 
+    # {caption: (key, ctrl, shift, alt)}
+    DefaultValues = {
+        caption: (values["key"], values.get("ctrl", False), values.get("shift", False), values.get("alt", False))
+        for caption, values in Defaults.items()
+    }
+
     def __init__(self, caption, key, func, ctrl=False, shift=False, alt=False):
         self.caption = caption
         self.key = key
@@ -54,17 +62,11 @@ class Hotkey:
 
     @classmethod
     def create_from_default(cls, caption, func):
-        if caption not in cls.Defaults:
+        if caption not in cls.DefaultValues:
             raise ValueError("{cap} is not a default shortcut".format(cap=caption))
 
-        return cls(
-            caption,
-            cls.Defaults[caption]["key"],
-            func,
-            cls.Defaults[caption].get("ctrl", False),
-            cls.Defaults[caption].get("shift", False),
-            cls.Defaults[caption].get("alt", False)
-        )
+        key, ctrl, shift, alt = cls.DefaultValues[caption]
+        return cls(caption, key, func, ctrl, shift, alt)
 
     def key_code(self):
         ctrl = QtCore.Qt.CTRL if self.ctrl else 0
@@ -81,22 +83,16 @@ class Hotkey:
 
     def matches(self, other_hotkey):
         return (
-            other_hotkey.shift == self.shift and
-            other_hotkey.ctrl == self.ctrl and
-            other_hotkey.alt == self.alt and
-            other_hotkey.key == self.key
+            (other_hotkey.key, other_hotkey.ctrl, other_hotkey.shift, other_hotkey.alt) ==
+            (self.key, self.ctrl, self.shift, self.alt)
         )
 
     def reset_to_default(self):
-        if self.caption not in self.__class__.Defaults:
+        values = self.__class__.DefaultValues.get(self.caption)
+        if values is None:
             return
 
-        values = self.__class__.Defaults[self.caption]
-
-        self.key = values["key"]
-        self.ctrl = values.get("ctrl", False)
-        self.shift = values.get("shift", False)
-        self.alt = values.get("alt", False)
+        self.key, self.ctrl, self.shift, self.alt = values
 
     def serialize(self):
         return {
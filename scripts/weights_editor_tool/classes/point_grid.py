@@ -0,0 +1,162 @@
+import math
+
+
+class PointGrid(object):
+    """
+    Buckets points into a uniform grid so finding the closest one only needs to check nearby cells.
+
+    Args:
+        points (float[][]): A list of xyz positions.
+    """
+
+    def __init__(self, points):
+        self._points = [tuple(point) for point in points]
+        self._cells = {}
+        self._cell_size = 1.0
+        self._min_cell = (0, 0, 0)
+        self._max_cell = (0, 0, 0)
+
+        if not self._points:
+            return
+
+        extents = [
+            max(point[i] for point in self._points) - min(point[i] for point in self._points)
+            for i in range(3)
+        ]
+
+        # Aim for a couple of points per cell, ignoring flat axes so planar meshes don't get huge cells.
+        # Flatness is relative to the largest extent, otherwise a bit of noise on a line, like a joint chain,
+        # counts as a full axis and makes the cells tiny.
+        max_extent = max(extents)
+        spread = [extent for extent in extents if extent > max_extent * 1e-3]
+        if spread:
+            volume = 1.0
+            for extent in spread:
+                volume *= extent
+
+            cell_size = math.pow(volume * 2.0 / len(self._points), 1.0 / len(spread))
+
+            # Never let a grid get more than 1000 cells along its widest axis.
+            self._cell_size = max(cell_size, max_extent * 1e-3)
+
+        for index, point in enumerate(self._points):
+            self._cells.setdefault(self._get_cell(point), []).append(index)
+
+        self._min_cell = tuple(min(cell[i] for cell in self._cells) for i in range(3))
+        self._max_cell = tuple(max(cell[i] for cell in self._cells) for i in range(3))
+
+    def _get_cell(self, point):
+        return (
+            int(math.floor(point[0] / self._cell_size)),
+            int(math.floor(point[1] / self._cell_size)),
+            int(math.floor(point[2] / self._cell_size))
+        )
+
+    def _get_ring_cells(self, center, ring, ranges):
+        """
+        Gets all occupied cells that are exactly `ring` cells away from the center.
+        Only the shell of the ring's box is visited, clipped to the supplied (start, end) ranges per axis.
+        """
+        cells = self._cells
+        cx, cy, cz = center
+        (x_start, x_end), (y_start, y_end), (z_start, z_end) = ranges
+
+        for x in range(x_start, x_end + 1):
+            x_on_shell = abs(x - cx) == ring
+
+            for y in range(y_start, y_end + 1):
+                if x_on_shell or abs(y - cy) == ring:
+                    zs = range(z_start, z_end + 1)
+                else:
+                    # Inside the shell on both x and y, so only its two z faces are left.
+                    zs = [z for z in (cz - ring, cz + ring) if z_start <= z <= z_end]
+
+                for z in zs:
+                    cell = (x, y, z)
+                    if cell in cells:
+                        yield cell
+
+    def _find_closest_linear(self, point):
+        px, py, pz = point[0], point[1], point[2]
+
+        closest_index = None
+        closest_dist = 0.0
+
+        for index, (x, y, z) in enumerate(self._points):
+            dist = (x - px) ** 2 + (y - py) ** 2 + (z - pz) ** 2
+
+            if closest_index is None or dist < closest_dist:
+                closest_index = index
+                closest_dist = dist
+
+        return closest_index
+
+    def find_closest(self, point):
+        """
+        Finds the closest point to the supplied position.
+
+        Args:
+            point (float[]): An xyz position to search from.
+
+        Returns:
+            The closest point's index, or None if the grid is empty.
+        """
+        if not self._cells:
+            return None
+
+        px, py, pz = point[0], point[1], point[2]
+
+        cell_size = self._cell_size
+        cx = int(math.floor(px / cell_size))
+        cy = int(math.floor(py / cell_size))
+        cz = int(math.floor(pz / cell_size))
+        center = (cx, cy, cz)
+
+        min_x, min_y, min_z = self._min_cell
+        max_x, max_y, max_z = self._max_cell
+
+        # Nothing can be closer than the first ring that touches the grid,
+        # and nothing is further than the ring that covers all of it.
+        start_ring = max(min_x - cx, cx - max_x, min_y - cy, cy - max_y, min_z - cz, cz - max_z, 0)
+
+        end_ring = max(
+            abs(cx - min_x), abs(cx - max_x),
+            abs(cy - min_y), abs(cy - max_y),
+            abs(cz - min_z), abs(cz - max_z))
+
+        closest_index = None
+        closest_dist = 0.0
+
+        cells = self._cells
+        points = self._points
+        point_count = len(points)
+
+        for ring in range(start_ring, end_ring + 1):
+            # Only search within the grid's bounds.
+            ranges = (
+                (max(cx - ring, min_x), min(cx + ring, max_x)),
+                (max(cy - ring, min_y), min(cy + ring, max_y)),
+                (max(cz - ring, min_z), min(cz + ring, max_z)))
+
+            box_count = 1
+            for start, end in ranges:
+                box_count *= end - start + 1
+
+            # Once a ring costs more to walk than checking every point, just check them all instead.
+            if box_count > point_count:
+                return self._find_closest_linear(point)
+
+            for cell in self._get_ring_cells(center, ring, ranges):
+                for index in cells[cell]:
+                    x, y, z = points[index]
+                    dist = (x - px) ** 2 + (y - py) ** 2 + (z - pz) ** 2
+
+                    if closest_index is None or dist < closest_dist:
+                        closest_index = index
+                        closest_dist = dist
+
+            # Points in any further rings are at least this far away.
+            if closest_index is not None and closest_dist <= (ring * cell_size) ** 2:
+                break
+
+        return closest_index
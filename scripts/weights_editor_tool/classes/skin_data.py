@@ -1,21 +1,23 @@
-import copy
-
 from maya import cmds
-from maya import OpenMaya
-from maya import OpenMayaAnim
+from maya.api import OpenMaya as om2
+from maya.api import OpenMayaAnim as oma2
 
 from weights_editor_tool.enums import WeightOperation
 from weights_editor_tool import weights_editor_utils as utils
 
 
-class SkinData:
+class SkinData(object):
+
+    __slots__ = ("data", "_lock_cache")
 
     def __init__(self, data):
         self.data = data
 
+        # {inf_name: is_locked}
+        self._lock_cache = {}
+
     def __iter__(self):
-        for vert_index in self.data:
-            yield vert_index
+        return iter(self.data)
 
     def __getitem__(self, vert_index):
         return self.data[vert_index]
@@ -34,64 +36,99 @@ class SkinData:
     @staticmethod
     def get_data(skin_cluster):
         """
-        Re-factored code by Tyler Thornock
-        Faster than cmds.skinPercent() and more practical than OpenMaya.MFnSkinCluster()
+        Based on code by Tyler Thornock, now collecting all weights with a single MFnSkinCluster.getWeights() call.
 
         Returns:
             A dictionary.
             {vert_index: {"weights": {inf_name: weight_value...}, "dq": float}}
         """
         # Create skin cluster function set
-        skin_cluster_mobj = utils.to_mobject(skin_cluster)
-        mfn_skin_cluster = OpenMayaAnim.MFnSkinCluster(skin_cluster_mobj)
+        msel_list = om2.MSelectionList()
+        msel_list.add(skin_cluster)
+        mfn_skin_cluster = oma2.MFnSkinCluster(msel_list.getDependNode(0))
 
-        # Get MPlugs for weights
-        weight_list_plug = mfn_skin_cluster.findPlug("weightList")
-        weights_plug = mfn_skin_cluster.findPlug("weights")
-        weight_list_obj = weight_list_plug.attribute()
-        weight_obj = weights_plug.attribute()
-        weight_inf_ids = OpenMaya.MIntArray()
+        # Get the skinned shape and all of its components to query.
+        output_index = mfn_skin_cluster.indexForOutputConnection(0)
+        shape_dag_path = mfn_skin_cluster.getPathAtIndex(output_index)
 
-        skin_weights = {}
+        vert_count = utils.get_vert_count(shape_dag_path.fullPathName())
 
-        # Get current ids
-        inf_ids = utils.get_influence_ids(skin_cluster)
-        vert_count = weight_list_plug.numElements()
+        if shape_dag_path.apiType() == om2.MFn.kNurbsCurve:
+            component_type = om2.MFn.kCurveCVComponent
+        else:
+            component_type = om2.MFn.kMeshVertComponent
 
-        for vert_index in range(vert_count):
-            data = {}
+        mfn_components = om2.MFnSingleIndexedComponent()
+        components = mfn_components.create(component_type)
+        mfn_components.setCompleteData(vert_count)
 
-            # Get inf indexes of non-zero weights
-            weights_plug.selectAncestorLogicalIndex(vert_index, weight_list_obj)
-            weights_plug.getExistingArrayAttributeIndices(weight_inf_ids)
+        # Weights are returned in the same order as the influence objects.
+        inf_dag_paths = mfn_skin_cluster.influenceObjects()
 
-            # {inf_name:weight_value...}
-            vert_weights = {}
-            inf_plug = OpenMaya.MPlug(weights_plug)
+        inf_names = [
+            inf_dag_paths[i].partialPathName()
+            for i in range(len(inf_dag_paths))
+        ]
+
+        # Get all weights in one flat array, which is faster than walking the weightList plugs.
+        weights = []
 
-            for inf_id in weight_inf_ids:
-                inf_plug.selectAncestorLogicalIndex(inf_id, weight_obj)
+        if inf_names:
+            weights, _ = mfn_skin_cluster.getWeights(shape_dag_path, components)
 
-                try:
-                    inf_name = inf_ids[inf_id]
-                    vert_weights[inf_name] = inf_plug.asDouble()
-                except KeyError:
-                    pass
+        inf_count = len(inf_names)
 
-            data["weights"] = vert_weights
+        # Walk the existing dual-quarternion elements directly, unset ones are left to default to 0.
+        dq_plug = mfn_skin_cluster.findPlug("blendWeights", False)
+        dq_values = {}
 
-            dq_value = cmds.getAttr("{0}.bw[{1}]".format(skin_cluster, vert_index))
-            data["dq"] = dq_value
+        for i in range(dq_plug.evaluateNumElements()):
+            dq_element = dq_plug.elementByPhysicalIndex(i)
+            dq_values[dq_element.logicalIndex()] = dq_element.asDouble()
 
-            skin_weights[vert_index] = data
+        skin_weights = {}
+
+        for vert_index in range(vert_count):
+            offset = vert_index * inf_count
+
+            # {inf_name:weight_value...}
+            vert_weights = {}
+
+            # Only keep non-zero weights.
+            for i in range(inf_count):
+                weight_value = weights[offset + i]
+                if weight_value != 0:
+                    vert_weights[inf_names[i]] = weight_value
+
+            skin_weights[vert_index] = {
+                "weights": vert_weights,
+                "dq": dq_values.get(vert_index, 0.0)
+            }
 
         return skin_weights
 
+    @staticmethod
+    def copy_vertex_data(vert_data):
+        """
+        Copies a vertex's data without going through deepcopy, since only its weights dict is mutable.
+        """
+        vert_copy = vert_data.copy()
+        vert_copy["weights"] = vert_data["weights"].copy()
+        return vert_copy
+
     def copy(self):
-        return self.__class__(copy.deepcopy(self.data))
+        if self.data is None:
+            return self.__class__(None)
+
+        copy_vertex_data = self.copy_vertex_data
+
+        return self.__class__({
+            vert_index: copy_vertex_data(vert_data)
+            for vert_index, vert_data in self.data.items()
+        })
 
     def copy_vertex(self, vert_index):
-        return copy.deepcopy(self.data[vert_index])
+        return self.copy_vertex_data(self.data[vert_index])
 
     def get_vertex_infs(self, vert_index):
         try:
@@ -111,6 +148,19 @@ class SkinData:
         else:
             raise NotImplementedError("Weight operation hasn't been implemented")
 
+    def _is_inf_locked(self, inf_name):
+        is_locked = self._lock_cache.get(inf_name)
+        if is_locked is None:
+            is_locked = cmds.getAttr("{0}.lockInfluenceWeights".format(inf_name))
+            self._lock_cache[inf_name] = is_locked
+        return is_locked
+
+    def clear_lock_cache(self):
+        """
+        Needs to be called before each edit, since locks can also be changed outside of the tool.
+        """
+        self._lock_cache = {}
+
     def update_weight_value(self, vert_index, inf_name, new_value):
         """
         Updates weight_data with an influence's value while distributing the difference
@@ -125,8 +175,7 @@ class SkinData:
             raise ValueError("Value needs to be within 0.0 to 1.0.")
 
         # Ignore if trying to set to a locked influence
-        is_inf_locked = cmds.getAttr("{0}.lockInfluenceWeights".format(inf_name))
-        if is_inf_locked:
+        if self._is_inf_locked(inf_name):
             return
 
         weight_data = self.data[vert_index]["weights"]
@@ -135,37 +184,28 @@ class SkinData:
         if inf_name not in weight_data:
             weight_data[inf_name] = 0
 
-        # Get total of all unlocked weights
-        total = 0
-        unlock_count = 0
-        for inf in weight_data:
-            is_locked = cmds.getAttr("{0}.lockInfluenceWeights".format(inf))
-            if not is_locked:
-                total += weight_data[inf]
-                unlock_count += 1
+        # Check locks once and get total of all unlocked weights
+        unlocked_infs = [inf for inf in weight_data if not self._is_inf_locked(inf)]
+        total = sum(weight_data[inf] for inf in unlocked_infs)
 
-        if unlock_count > 1:
+        if len(unlocked_infs) > 1:
             # New value must not exceed total
             new_value = min(new_value, total)
 
             # Distribute weights
             dif = (total - new_value) / (total - weight_data[inf_name])
 
-            for inf in weight_data:
-                is_locked = cmds.getAttr("{0}.lockInfluenceWeights".format(inf))
-                if is_locked:
-                    continue
+            for inf in unlocked_infs:
+                weight_data[inf] *= dif
 
-                if inf == inf_name:
-                    weight_data[inf] = new_value
-                else:
-                    weight_data[inf] *= dif
+            weight_data[inf_name] = new_value
 
-        for key in list(weight_data.keys()):
-            if utils.is_close(0.0, weight_data[key]):
-                weight_data.pop(key)
+        # Same tolerance as utils.is_close against 0.0, without a function call per influence.
+        zero_infs = [inf for inf, value in weight_data.items() if abs(value) <= 1e-15]
+        for inf in zero_infs:
+            del weight_data[inf]
 
         # Force weight to be 1 if there's only one influence left
         if len(weight_data) == 1:
-            key = list(weight_data.keys())[0]
-            weight_data[key] = 1.0
+            for key in weight_data:
+                weight_data[key] = 1.0
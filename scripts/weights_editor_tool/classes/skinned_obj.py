@@ -1,7 +1,8 @@
 import sys
 import os
-import random
 import glob
+import colorsys
+from multiprocessing.pool import ThreadPool
 
 if sys.version_info < (3, 0):
     import cPickle
@@ -11,8 +12,8 @@ else:
 from maya import cmds
 from maya import OpenMaya
 from maya.api import OpenMaya as om2
+from maya.api import OpenMayaAnim as oma2
 
-from PySide2 import QtGui
 from PySide2 import QtWidgets
 
 from weights_editor_tool import constants
@@ -20,20 +21,33 @@ from weights_editor_tool.enums import ColorTheme
 from weights_editor_tool import weights_editor_utils as utils
 from weights_editor_tool.widgets import status_progress_bar
 from weights_editor_tool.classes.skin_data import SkinData
+from weights_editor_tool.classes.point_grid import PointGrid
 
 
-class SkinnedObj:
+class SkinnedObj(object):
 
     last_browsing_path = None
 
     def __init__(self, obj):
         self.name = obj
         self.skin_cluster = None
-        self.skin_data = None
+        self._skin_data = None
         self.vert_count = 0
         self.infs = []
+        self.inf_indexes = {}
         self.inf_colors = {}
 
+        # The influences and settings that inf_colors was last generated with.
+        self._inf_colors_key = None
+
+        # Influence queries are cached until the skinCluster changes.
+        self._inf_cache = None
+        self._inf_id_cache = None
+        self._inf_column_cache = None
+
+        # {vert_index: [vert_index...]}
+        self._neighbours_cache = None
+
         if self.is_valid():
             self.vert_count = utils.get_vert_count(self.name)
             self.update_skin_data()
@@ -71,15 +85,40 @@ class SkinnedObj:
             return picked_path[0]
 
     @staticmethod
-    def _find_influence_by_name(long_name):
-        short_name = long_name.split("|")[-1]
-        objs = cmds.ls(short_name)
+    def _resolve_influences(long_names):
+        """
+        Finds scene objects for all of the influence names with one ls call.
+
+        Args:
+            long_names(string[]): Influence names, usually from a skin file.
+
+        Returns:
+            A dictionary of {long_name: scene_name}. The scene name is None if it couldn't be found.
+        """
+        long_names = set(long_names)
+        if not long_names:
+            return {}
+
+        short_names = set(long_name.split("|")[-1] for long_name in long_names)
+
+        # Bucket matches by their short name.
+        objs_by_short_name = {}
+        for obj in cmds.ls(list(short_names)):
+            objs_by_short_name.setdefault(obj.split("|")[-1], []).append(obj)
 
-        if objs:
-            if long_name in objs:
-                return long_name
+        resolved = {}
+
+        for long_name in long_names:
+            objs = objs_by_short_name.get(long_name.split("|")[-1])
+
+            if not objs:
+                resolved[long_name] = None
+            elif long_name in objs:
+                resolved[long_name] = long_name
             else:
-                return objs[0]
+                resolved[long_name] = objs[0]
+
+        return resolved
 
     @staticmethod
     def _get_dag_path(obj):
@@ -97,64 +136,107 @@ class SkinnedObj:
         dag_path = cls._get_dag_path(curve)
         return om2.MFnNurbsCurve(dag_path)
 
+    def _get_mfn_skin_cluster(self):
+        msel_list = om2.MSelectionList()
+        msel_list.add(self.skin_cluster)
+        return oma2.MFnSkinCluster(msel_list.getDependNode(0))
+
+    def _create_components(self, vert_indexes, shape_dag_path=None):
+        # The shape's type is already known if it's supplied, so no need to ask Maya.
+        if shape_dag_path is not None:
+            is_curve = shape_dag_path.apiType() == om2.MFn.kNurbsCurve
+        else:
+            is_curve = utils.is_curve(self.name)
+
+        if is_curve:
+            component_type = om2.MFn.kCurveCVComponent
+        else:
+            component_type = om2.MFn.kMeshVertComponent
+
+        mfn_components = om2.MFnSingleIndexedComponent()
+        components = mfn_components.create(component_type)
+        mfn_components.addElements(vert_indexes)
+        return components
+
     def _get_world_points(self, space=om2.MSpace.kWorld):
-        if cmds.listRelatives(self.name, shapes=True, type="mesh"):
-            mfn_mesh = self._to_mfn_mesh(self.name)
-            return mfn_mesh.getPoints(space)
-        elif cmds.listRelatives(self.name, shapes=True, type="nurbsCurve"):
-            mfn_nurbs_curve = self._to_mfn_nurbs_curve(self.name)
-            return mfn_nurbs_curve.cvPositions(space)
+        # Resolve the path once and check its type instead of going through listRelatives.
+        dag_path = self._get_dag_path(self.name)
+
+        if dag_path.hasFn(om2.MFn.kMesh):
+            return om2.MFnMesh(dag_path).getPoints(space)
+        elif dag_path.hasFn(om2.MFn.kNurbsCurve):
+            return om2.MFnNurbsCurve(dag_path).cvPositions(space)
         else:
             raise NotImplementedError("This object's type is not supported: {0}".format(self.name))
 
-    def _map_to_closest_vertexes(self, verts_data, vert_filter=[]):
-        weights_data = {}
+    @staticmethod
+    def _read_skin_file(file_path):
+        with open(file_path, "rb") as f:
+            skin_data = cPickle.load(f)
 
-        file_points = [
-            om2.MPoint(*verts_data[index]["world_pos"])
-            for index in sorted(verts_data.keys())
-        ]
+        # Pickle keeps int keys as they are, so only rebuild if the file has any other kind.
+        if not all(type(key) is int for key in skin_data["verts"]):
+            skin_data["verts"] = {
+                int(key): value
+                for key, value in skin_data["verts"].items()
+            }
 
-        # Build a temporary new mesh from the file's positions so that it's exposed to the api.
-        temp_mfn_mesh = om2.MFnMesh()
-        temp_mfn_mesh.addPolygon(file_points, False, 0)
-        new_mesh = om2.MFnDagNode(temp_mfn_mesh.parent(0)).fullPathName()
-        file_mfn_mesh = self._to_mfn_mesh(new_mesh)
+        return skin_data
 
-        try:
-            mesh_points = self._get_world_points()
+    @staticmethod
+    def _write_skin_file(file_path, skin_data):
+        output_dir = os.path.dirname(file_path)
+        if output_dir and not os.path.exists(output_dir):
+            try:
+                os.makedirs(output_dir)
+            except OSError:
+                # Another export may have just created it.
+                if not os.path.isdir(output_dir):
+                    raise
+
+        # Protocol is pinned so files can be shared across Maya versions (Python 2.7 can't read past 2).
+        with open(file_path, "wb") as f:
+            cPickle.dump(skin_data, f, 2)
 
-            with status_progress_bar.StatusProgressBar("Finding closest points", len(mesh_points)) as pbar:
-                for vert_index, point in enumerate(mesh_points):
-                    try:
-                        # Skip calculations if index is not in the filter.
-                        if vert_filter and vert_index not in vert_filter:
-                            continue
+    def _map_to_closest_vertexes(self, verts_data, vert_filter=None):
+        weights_data = {}
+        vert_filter = frozenset(vert_filter or ())
 
-                        # Get the closest face.
-                        closest_point = file_mfn_mesh.getClosestPoint(point, om2.MSpace.kWorld)
-                        face_index = closest_point[1]
+        # Bucket the file's positions so each vertex only needs to compare against nearby ones.
+        file_indexes = sorted(verts_data.keys())
+        file_points = [tuple(verts_data[index]["world_pos"]) for index in file_indexes]
+        point_grid = PointGrid(file_points)
 
-                        # Get face's vertexes and get the closest vertex.
-                        face_vertexes = file_mfn_mesh.getPolygonVertices(face_index)
+        # Importing back onto the same mesh lands exactly on the file's positions, so those skip the search.
+        exact_indexes = {}
+        for index, file_point in zip(file_indexes, file_points):
+            exact_indexes.setdefault(file_point, index)
 
-                        vert_distances = [
-                            (index, file_points[index].distanceTo(closest_point[0]))
-                            for index in face_vertexes
-                        ]
+        mesh_points = self._get_world_points()
+        point_count = len(mesh_points)
 
-                        closest_index = min(vert_distances, key=lambda dist: dist[1])[0]
-                        weights_data[vert_index] = closest_index
+        # Only go through the filter's vertexes instead of skipping past the rest.
+        if vert_filter:
+            vert_indexes = sorted(index for index in vert_filter if 0 <= index < point_count)
+        else:
+            vert_indexes = range(point_count)
 
-                        if pbar.was_cancelled():
-                            raise RuntimeError("User cancelled")
-                    finally:
-                        pbar.next()
-        finally:
-            if cmds.objExists(new_mesh):
-                cmds.undoInfo(stateWithoutFlush=False)
-                cmds.delete(new_mesh)
-                cmds.undoInfo(stateWithoutFlush=True)
+        with status_progress_bar.StatusProgressBar("Finding closest points", len(vert_indexes)) as pbar:
+            for vert_index in vert_indexes:
+                try:
+                    point = mesh_points[vert_index]
+                    point = (point.x, point.y, point.z)
+
+                    file_index = exact_indexes.get(point)
+                    if file_index is None:
+                        file_index = file_indexes[point_grid.find_closest(point)]
+
+                    weights_data[vert_index] = file_index
+
+                    if pbar.was_cancelled():
+                        raise RuntimeError("User cancelled")
+                finally:
+                    pbar.next()
 
         return weights_data
 
@@ -167,24 +249,43 @@ class SkinnedObj:
     def short_name(self):
         return self.name.split("|")[-1]
 
+    @property
+    def skin_data(self):
+        """
+        Weights are only collected when they're first needed, since that's the slowest part of loading an object.
+        """
+        if self._skin_data is None:
+            if self.skin_cluster:
+                self._skin_data = SkinData.get(self.skin_cluster)
+            else:
+                self._skin_data = SkinData.create_empty()
+
+        return self._skin_data
+
+    @skin_data.setter
+    def skin_data(self, value):
+        self._skin_data = value
+
     def update_skin_data(self):
         self.skin_cluster = None
-        self.skin_data = SkinData.create_empty()
+        self._skin_data = None
+        self._neighbours_cache = None
+        self.invalidate_influence_cache()
 
         if self.is_valid():
             self.skin_cluster = utils.get_skin_cluster(self.name)
 
             if self.skin_cluster:
-                self.skin_data = SkinData.get(self.skin_cluster)
                 self.collect_influence_colors()
-                self.infs = self.get_all_infs()
+                self.update_infs()
 
     def is_skin_corrupt(self):
         """
         Checks if topology changes were done after the skinCluster was applied.
         """
         vert_count = utils.get_vert_count(self.name)
-        weights_count = len(cmds.getAttr("{0}.weightList[*]".format(self.skin_cluster)))
+        # Only the element count is needed, so don't pull every weight value.
+        weights_count = cmds.getAttr("{0}.weightList".format(self.skin_cluster), size=True)
         return vert_count != weights_count
 
     def get_all_infs(self):
@@ -192,7 +293,31 @@ class SkinnedObj:
         Gets and returns a list of all influences from the active skinCluster.
         Also collects unique colors of each influence for the Softimage theme.
         """
-        return sorted(utils.get_influences(self.skin_cluster))
+        if self._inf_cache is None:
+            self._inf_cache = sorted(utils.get_influences(self.skin_cluster))
+
+        # Return a copy since callers are free to modify it.
+        return list(self._inf_cache)
+
+    def invalidate_influence_cache(self):
+        """
+        Forces influences to be queried again. Call this after influences are added or removed from the skinCluster.
+        """
+        self._inf_cache = None
+        self._inf_id_cache = None
+        self._inf_column_cache = None
+
+    def update_infs(self):
+        """
+        Re-collects influences along with a lookup of their indexes.
+        """
+        self.infs = self.get_all_infs()
+
+        # {inf_name: index}
+        self.inf_indexes = {
+            inf: i
+            for i, inf in enumerate(self.infs)
+        }
 
     def select_inf_vertexes(self, infs):
         """
@@ -201,61 +326,75 @@ class SkinnedObj:
         Args:
             infs(string[]): List of influences to select from.
         """
-        infs_set = set(infs)
-        effected_verts = set()
+        infs_set = frozenset(infs)
 
-        for vert_index in self.skin_data:
-            vert_infs = self.skin_data[vert_index]["weights"].keys()
+        # Stops at the first shared influence without building a new set per vertex.
+        effected_indexes = [
+            vert_index
+            for vert_index, vert_data in self.skin_data.data.items()
+            if not infs_set.isdisjoint(vert_data["weights"])
+        ]
 
-            is_effected = infs_set.intersection(vert_infs)
-            if is_effected:
-                if utils.is_curve(self.name):
-                    effected_verts.add("{0}.cv[{1}]".format(self.name, vert_index))
-                else:
-                    effected_verts.add("{0}.vtx[{1}]".format(self.name, vert_index))
+        if utils.is_curve(self.name):
+            component = "cv"
+        else:
+            component = "vtx"
 
-        cmds.select(list(effected_verts))
+        cmds.select(utils.get_component_ranges(self.name, effected_indexes, component=component))
 
     def flood_weights_to_closest(self):
         """
         Each vertex will be assigned a full weight to its closest joint.
         """
-        influences = self.get_influence_ids()
+        mfn_skin_cluster = self._get_mfn_skin_cluster()
+        output_index = mfn_skin_cluster.indexForOutputConnection(0)
+        shape_dag_path = mfn_skin_cluster.getPathAtIndex(output_index)
 
-        inf_positions = {
-            key: cmds.xform(inf, q=True, ws=True, t=True)
-            for key, inf in influences.items()
-        }
+        inf_dag_paths = mfn_skin_cluster.influenceObjects()
+        inf_count = len(inf_dag_paths)
+        if not inf_count:
+            return
 
-        verts = cmds.ls("{}.vtx[*]".format(self.name), flatten=True)
+        inf_positions = []
+        for i in range(inf_count):
+            inf_pos = om2.MTransformationMatrix(inf_dag_paths[i].inclusiveMatrix()).translation(om2.MSpace.kWorld)
+            inf_positions.append((inf_pos.x, inf_pos.y, inf_pos.z))
 
-        vert_inf_mappings = {}
+        if inf_count > constants.MAX_LINEAR_CLOSEST_INFS:
+            # Bucket influence positions so each vertex only compares against the ones nearby.
+            find_closest = PointGrid(inf_positions).find_closest
+        else:
+            # Not worth a grid for a typical rig, so compare against all of them.
+            def find_closest(point):
+                px, py, pz = point
 
-        for vert_index, plug, in enumerate(verts):
-            vert_pos = cmds.pointPosition(plug, world=True)
-            vert_point = OpenMaya.MPoint(*vert_pos)
+                closest_column = 0
+                closest_dist = None
 
-            closest_inf_index = None
-            closest_inf_dist = 0
+                for column, (x, y, z) in enumerate(inf_positions):
+                    dist = (x - px) ** 2 + (y - py) ** 2 + (z - pz) ** 2
+                    if closest_dist is None or dist < closest_dist:
+                        closest_column = column
+                        closest_dist = dist
 
-            for inf_index in inf_positions:
-                inf_point = OpenMaya.MPoint(*inf_positions[inf_index])
-                dist = vert_point.distanceTo(inf_point)
-                if closest_inf_index is None or dist < closest_inf_dist:
-                    closest_inf_index = inf_index
-                    closest_inf_dist = dist
+                return closest_column
 
-            vert_inf_mappings[vert_index] = closest_inf_index
+        mesh_points = self._get_world_points()
+        vert_count = len(mesh_points)
 
-        cmds.setAttr("{0}.nw".format(self.skin_cluster), 0)
-        cmds.skinPercent(self.skin_cluster, verts, prw=100, nrm=0)
+        # Every column gets written, so anything that isn't the closest influence gets cleared to 0.
+        weights = om2.MDoubleArray(vert_count * inf_count, 0.0)
 
-        for vert_index, inf_index in vert_inf_mappings.items():
-            weight_plug = "{0}.weightList[{1}].weights[{2}]".format(self.skin_cluster, vert_index, inf_index)
-            cmds.setAttr(weight_plug, 1)
+        for vert_index, pnt in enumerate(mesh_points):
+            inf_column = find_closest((pnt.x, pnt.y, pnt.z))
+            weights[vert_index * inf_count + inf_column] = 1.0
 
-        cmds.setAttr("{0}.nw".format(self.skin_cluster), 1)
-        cmds.skinCluster(self.skin_cluster, e=True, forceNormalizeWeights=True)
+        mfn_skin_cluster.setWeights(
+            shape_dag_path,
+            self._create_components(list(range(vert_count)), shape_dag_path),
+            om2.MIntArray(list(range(inf_count))),
+            weights,
+            False)
 
     def prune_weights(self, value):
         """
@@ -272,19 +411,35 @@ class SkinnedObj:
             OpenMaya.MGlobal.displayError("No vertexes are selected.")
             return False
 
-        cmds.skinPercent(self.skin_cluster, flatten_list, prw=value, nrm=True)
+        if utils.is_curve(self.name):
+            component = "cv"
+        else:
+            component = "vtx"
+
+        # Collapse the selection into ranges so Maya doesn't need to parse every vertex on its own.
+        vert_ranges = utils.get_component_ranges(self.name, utils.extract_indexes(flatten_list), component=component)
+
+        cmds.skinPercent(self.skin_cluster, vert_ranges, prw=value, nrm=True)
 
         return True
 
-    def prune_max_infs(self, max_inf_count, vert_filter=[]):
+    def prune_max_infs(self, max_inf_count, vert_filter=None):
         if not vert_filter:
             OpenMaya.MGlobal.displayError("No vertexes are selected.")
             return False
 
-        for vert_index in self.skin_data:
-            if vert_filter and vert_index not in vert_filter:
-                continue
+        vert_indexes = self._get_filtered_vert_indexes(vert_filter)
+
+        infs = set()
+        for vert_index in vert_indexes:
+            infs.update(self.skin_data[vert_index]["weights"])
 
+        lock_map = self._get_lock_map(infs)
+
+        # Locks may have been changed outside the tool since the last edit.
+        self.skin_data.clear_lock_cache()
+
+        for vert_index in vert_indexes:
             sorted_infs = [
                 inf for inf, value in sorted(self.skin_data[vert_index]["weights"].items(), key=lambda item: item[1])]
 
@@ -293,21 +448,19 @@ class SkinnedObj:
                 if infs_count <= max_inf_count:
                     break
 
-                locked = cmds.getAttr("{0}.lockInfluenceWeights".format(inf))
-                if locked:
+                if lock_map[inf]:
                     continue
 
                 self.skin_data.update_weight_value(vert_index, inf, 0)
 
         return True
 
-    def mirror_skin_weights(self, mirror_mode, mirror_inverse, surface_association, inf_association=None, vert_filter=[]):
+    def mirror_skin_weights(self, mirror_mode, mirror_inverse, surface_association, inf_association=None, vert_filter=None):
         objs = self.name
-        if vert_filter:
-            objs = [
-                "{0}.vtx[{1}]".format(self.name, index)
-                for index in vert_filter
-            ]
+
+        # A filter covering every vertex is the same as passing the object itself.
+        if vert_filter and len(set(vert_filter)) < utils.get_vert_count(self.name):
+            objs = utils.get_component_ranges(self.name, vert_filter)
 
         if inf_association is None:
             inf_association = "closestJoint"
@@ -319,7 +472,25 @@ class SkinnedObj:
             surfaceAssociation=surface_association,
             influenceAssociation=[inf_association, "closestJoint"])
 
-    def display_influence(self, influence, color_style=ColorTheme.Max, vert_filter=[]):
+    def _get_filtered_vert_indexes(self, vert_filter=None):
+        """
+        Gets vertex indexes that have skin data.
+        With a filter only its vertexes are visited, instead of checking every vertex against it.
+        """
+        data = self.skin_data.data
+        if not data:
+            return []
+
+        if vert_filter:
+            return [
+                vert_index
+                for vert_index in vert_filter
+                if vert_index in data
+            ]
+
+        return list(data)
+
+    def display_influence(self, influence, color_style=ColorTheme.Max, vert_filter=None):
         """
         Colors a mesh to visualize skin data.
 
@@ -349,32 +520,26 @@ class SkinnedObj:
             no_rgb = [0, 0, 0]
             full_rgb = [0, 0, 0]
 
-        vert_colors = []
-        vert_indexes = []
-
-        for vert_index in self.skin_data:
-            if vert_filter and vert_index not in vert_filter:
-                continue
+        vert_indexes = self._get_filtered_vert_indexes(vert_filter)
 
-            weights_data = self.skin_data[vert_index]["weights"]
+        skin_data = self.skin_data.data
 
-            if influence in weights_data:
-                weight_value = weights_data[influence]
-                rgb = utils.get_weight_color(
-                    weight_value,
-                    start_color=low_rgb,
-                    mid_color=mid_rgb,
-                    end_color=end_rgb,
-                    full_color=full_rgb)
-            else:
-                rgb = no_rgb
+        weight_values = [
+            skin_data[vert_index]["weights"].get(influence)
+            for vert_index in vert_indexes
+        ]
 
-            vert_colors.append(rgb)
-            vert_indexes.append(vert_index)
+        vert_colors = utils.get_weight_colors(
+            weight_values,
+            start_color=low_rgb,
+            mid_color=mid_rgb,
+            end_color=end_rgb,
+            full_color=full_rgb,
+            no_color=no_rgb)
 
         utils.apply_vert_colors(self.name, vert_colors, vert_indexes)
 
-    def display_multi_color_influence(self, vert_filter=[]):
+    def display_multi_color_influence(self, vert_filter=None):
         """
         Mimics Softimage and displays all influences at once with their own unique color.
 
@@ -384,31 +549,41 @@ class SkinnedObj:
         Returns:
             A dictionary of {inf_name:[r, g, b]...}
         """
-
         if self.inf_colors is None:
             self.collect_influence_colors()
 
         vert_colors = []
         vert_indexes = []
 
-        for vert_index in self.skin_data:
-            if vert_filter and vert_index not in vert_filter:
-                continue
+        inf_colors = self.inf_colors
 
-            final_color = [0, 0, 0]
+        skin_data = self.skin_data.data
 
-            for inf, weight in self.skin_data[vert_index]["weights"].items():
-                inf_color = self.inf_colors.get(inf)
-                final_color[0] += inf_color[0] * weight
-                final_color[1] += inf_color[1] * weight
-                final_color[2] += inf_color[2] * weight
+        for vert_index in self._get_filtered_vert_indexes(vert_filter):
+            vert_weights = skin_data[vert_index]["weights"]
+
+            if len(vert_weights) == 1:
+                # Rigid verts are common and only need their one color scaled.
+                for inf, weight in vert_weights.items():
+                    inf_r, inf_g, inf_b = inf_colors[inf]
+                    vert_colors.append([inf_r * weight, inf_g * weight, inf_b * weight])
+            else:
+                # Accumulate in locals instead of indexing into a list for every channel.
+                r = g = b = 0.0
+
+                for inf, weight in vert_weights.items():
+                    inf_r, inf_g, inf_b = inf_colors[inf]
+                    r += inf_r * weight
+                    g += inf_g * weight
+                    b += inf_b * weight
+
+                vert_colors.append([r, g, b])
 
-            vert_colors.append(final_color)
             vert_indexes.append(vert_index)
 
         utils.apply_vert_colors(self.name, vert_colors, vert_indexes)
 
-    def display_max_influences(self, max_inf_count, vert_filter=[]):
+    def display_max_influences(self, max_inf_count, vert_filter=None):
         """
         Displays verts that are over the supplied maximum inflluence count.
 
@@ -422,11 +597,10 @@ class SkinnedObj:
         vert_colors = []
         vert_indexes = []
 
-        for vert_index in self.skin_data:
-            if vert_filter and vert_index not in vert_filter:
-                continue
+        skin_data = self.skin_data.data
 
-            inf_count = len(self.skin_data[vert_index]["weights"])
+        for vert_index in self._get_filtered_vert_indexes(vert_filter):
+            inf_count = len(skin_data[vert_index]["weights"])
 
             if inf_count > max_inf_count:  # Over the count.
                 final_color = [1, 0, 0]
@@ -438,13 +612,70 @@ class SkinnedObj:
 
         utils.apply_vert_colors(self.name, vert_colors, vert_indexes)
 
-    def average_by_neighbours(self, vert_index, strength):
+    def _get_lock_map(self, infs):
+        """
+        Queries lock states of the supplied influences so they can be looked up many times.
+
+        Returns:
+            A dictionary of {inf_name: is_locked}
+        """
+        return {
+            inf: cmds.getAttr("{0}.lockInfluenceWeights".format(inf))
+            for inf in infs
+        }
+
+    def _cache_vert_neighbours(self, vert_indexes):
+        """
+        Collects adjacent vertexes with a single mesh iterator, including each vertex itself.
+        Results stay cached since smoothing keeps asking for the same vertexes.
+        """
+        if self._neighbours_cache is None:
+            self._neighbours_cache = {}
+
+        missing_indexes = [
+            vert_index
+            for vert_index in vert_indexes
+            if vert_index not in self._neighbours_cache
+        ]
+
+        if not missing_indexes:
+            return
+
+        if utils.is_curve(self.name):
+            for vert_index in missing_indexes:
+                self._neighbours_cache[vert_index] = []
+            return
+
+        mfn_skin_cluster = self._get_mfn_skin_cluster()
+        output_index = mfn_skin_cluster.indexForOutputConnection(0)
+        mit_vert = om2.MItMeshVertex(mfn_skin_cluster.getPathAtIndex(output_index))
+
+        if mit_vert.count() <= constants.MAX_NEIGHBOURS_PRECACHE_VERTS:
+            # Cheap enough to walk the whole mesh once, so later smooths on other vertexes don't need to query.
+            while not mit_vert.isDone():
+                vert_index = mit_vert.index()
+                self._neighbours_cache[vert_index] = list(mit_vert.getConnectedVertices()) + [vert_index]
+                mit_vert.next()
+        else:
+            for vert_index in missing_indexes:
+                mit_vert.setIndex(vert_index)
+                self._neighbours_cache[vert_index] = list(mit_vert.getConnectedVertices()) + [vert_index]
+
+    def _get_vert_neighbours(self, vert_index):
+        """
+        Gets adjacent vertexes, including the vertex itself.
+        """
+        self._cache_vert_neighbours([vert_index])
+        return self._neighbours_cache[vert_index]
+
+    def average_by_neighbours(self, vert_index, strength, lock_map=None):
         """
         Averages weights of surrounding vertexes.
 
         Args:
             vert_index(int)
             strength(int): A value of 0-1
+            lock_map(dict): Influence lock states from _get_lock_map. Gets queried if None.
 
         Returns:
             A dictionary of the new weights. {int_name:weight_value...}
@@ -452,16 +683,18 @@ class SkinnedObj:
         old_weights = self.skin_data[vert_index]["weights"]
         new_weights = {}
 
+        if lock_map is None:
+            lock_map = self._get_lock_map(old_weights)
+
         # Collect unlocked infs and total value of unlocked weights
-        unlocked = []
+        unlocked = set()
         total = 0.0
 
         for inf in old_weights:
-            is_locked = cmds.getAttr("{0}.lockInfluenceWeights".format(inf))
-            if is_locked:
+            if lock_map[inf]:
                 new_weights[inf] = old_weights[inf]
             else:
-                unlocked.append(inf)
+                unlocked.add(inf)
                 total += old_weights[inf]
 
         # Need at least 2 unlocked influences to continue
@@ -469,33 +702,29 @@ class SkinnedObj:
             return old_weights
 
         # Add together weight of each influence from neighbours
-        neighbours = utils.get_vert_neighbours(self.name, vert_index)
+        neighbours = self._get_vert_neighbours(vert_index)
 
-        for index in neighbours:
-            for inf, value in self.skin_data[index]["weights"].items():
-                # Ignore if locked
-                if inf not in unlocked:
-                    continue
+        skin_data = self.skin_data.data
 
-                # Add weight
-                if inf not in new_weights:
-                    new_weights[inf] = 0.0
+        # Sum of all new weight values, tallied as they're added
+        total_all = 0.0
 
-                new_weights[inf] += value
-
-        # Get sum of all new weight values
-        total_all = sum([
-            new_weights[inf]
-            for inf in new_weights
-            if inf in unlocked
-        ])
+        for index in neighbours:
+            for inf, value in skin_data[index]["weights"].items():
+                # Add weight, ignoring locked influences
+                if inf in unlocked:
+                    new_weights[inf] = new_weights.get(inf, 0.0) + value
+                    total_all += value
 
         # Average values
         if total_all:
-            for inf in new_weights:
-                if inf in unlocked:
-                    new_weight = new_weights[inf] * (total / total_all)
-                    new_weights[inf] = old_weights[inf] + (new_weight - old_weights[inf]) * strength
+            scale = total / total_all
+
+            # Only unlocked influences need blending, locked ones were copied over as they were.
+            for inf in unlocked:
+                if inf in new_weights:
+                    old_weight = old_weights[inf]
+                    new_weights[inf] = old_weight + (new_weights[inf] * scale - old_weight) * strength
 
         return new_weights
 
@@ -511,15 +740,38 @@ class SkinnedObj:
         # Don't set new weights right away so new values don't interfere
         # when calculating other indexes.
         weights_to_set = {}
+
+        # Query each influence's lock once instead of once per vertex.
+        infs = set()
+        for vert_index in vert_indexes:
+            infs.update(self.skin_data[vert_index]["weights"])
+
+        lock_map = self._get_lock_map(infs)
+
+        # No vertex can change if there's no strength or not enough unlocked influences between all of them.
+        unlocked_count = len([inf for inf, is_locked in lock_map.items() if not is_locked])
+        if not strength or unlocked_count < 2:
+            return
+
+        # Collect neighbours of all vertexes up front with one iterator.
+        self._cache_vert_neighbours(vert_indexes)
+
         for vert_index in vert_indexes:
-            new_weights = self.average_by_neighbours(vert_index, strength)
-            weights_to_set[vert_index] = new_weights
+            old_weights = self.skin_data[vert_index]["weights"]
+            new_weights = self.average_by_neighbours(vert_index, strength, lock_map=lock_map)
+
+            # Verts without enough unlocked influences come back untouched, so they don't need to be set again.
+            if new_weights is not old_weights:
+                weights_to_set[vert_index] = new_weights
+
+        if not weights_to_set:
+            return
 
         # Set weights
         for vert_index, weights in weights_to_set.items():
             self.skin_data[vert_index]["weights"] = weights
 
-        self.apply_current_skin_weights(vert_indexes, normalize=normalize_weights)
+        self.apply_current_skin_weights(list(weights_to_set), normalize=normalize_weights)
 
     def hide_vert_colors(self):
         if self.is_valid():
@@ -553,13 +805,38 @@ class SkinnedObj:
             cmds.addAttr(dif_color_sets[0], ln=constants.COLOR_SET, dt="string")
             cmds.rename(dif_color_sets[0], constants.COLOR_SET)
 
+    def is_skin_data_loaded(self):
+        """
+        Checks without triggering skin_data to collect its weights.
+        """
+        return self._skin_data is not None
+
     def has_skin_data(self):
         if self.skin_data is not None and self.skin_data.data:
             return True
         return False
 
+    def _get_inf_columns(self, mfn_skin_cluster):
+        """
+        Gets each influence's physical index, which is what setWeights expects instead of its logical id.
+
+        Returns:
+            A dictionary of {inf_name: index}
+        """
+        if self._inf_column_cache is None:
+            inf_dag_paths = mfn_skin_cluster.influenceObjects()
+            self._inf_column_cache = {
+                inf_dag_paths[i].partialPathName(): i
+                for i in range(len(inf_dag_paths))
+            }
+
+        return self._inf_column_cache
+
     def get_influence_ids(self):
-        return utils.get_influence_ids(self.skin_cluster)
+        if self._inf_id_cache is None:
+            self._inf_id_cache = utils.get_influence_ids(self.skin_cluster)
+
+        return dict(self._inf_id_cache)
 
     def collect_influence_colors(self, sat=250, brightness=150):
         """
@@ -571,24 +848,23 @@ class SkinnedObj:
             brightness(float)
         """
         infs = self.get_all_infs()
-        random.seed(0)
-        random.shuffle(infs)
-
-        inf_colors = {}
 
-        hue_step = 360.0 / (len(infs))
-
-        for i, inf in enumerate(infs):
-            color = QtGui.QColor()
-            color.setHsv(hue_step * i, sat, brightness)
-            color.toRgb()
+        # Colors only depend on these, so skip it if nothing changed since last time.
+        inf_colors_key = (tuple(infs), sat, brightness)
+        if inf_colors_key == self._inf_colors_key:
+            return
 
-            inf_colors[inf] = [
-                color.red() / 255.0,
-                color.green() / 255.0,
-                color.blue() / 255.0]
+        golden_ratio = 0.6180339887
+        saturation = sat / 255.0
+        value = brightness / 255.0
+        hsv_to_rgb = colorsys.hsv_to_rgb
 
-        self.inf_colors = inf_colors
+        # Stepping hues by the golden ratio keeps neighbouring influences far apart on the color wheel.
+        self.inf_colors = {
+            inf: list(hsv_to_rgb((i * golden_ratio) % 1.0, saturation, value))
+            for i, inf in enumerate(infs)
+        }
+        self._inf_colors_key = inf_colors_key
 
     def apply_current_skin_weights(self, vert_indexes, normalize=False, display_progress=False):
         """
@@ -599,67 +875,110 @@ class SkinnedObj:
             normalize(bool): Forces weights to be normalized.
             display_progress(bool): Displays a progress bar if enabled.
         """
-        # Get influence info to map with
-        inf_data = self.get_influence_ids()
-        inf_ids = list(inf_data.keys())
-        inf_names = list(inf_data.values())
+        mfn_skin_cluster = self._get_mfn_skin_cluster()
+        output_index = mfn_skin_cluster.indexForOutputConnection(0)
+        shape_dag_path = mfn_skin_cluster.getPathAtIndex(output_index)
 
-        # Remove all existing weights
-        if utils.is_curve(self.name):
-            plug = "{0}.cv".format(self.name)
-        else:
-            plug = "{0}.vtx".format(self.name)
+        inf_columns = self._get_inf_columns(mfn_skin_cluster)
+        inf_count = len(inf_columns)
 
-        selected_vertexes = [
-            "{0}[{1}]".format(plug, index)
-            for index in vert_indexes
-        ]
+        # Collect all weights in a flat array so they can be set in one call.
+        weights = om2.MDoubleArray(len(vert_indexes) * inf_count, 0.0)
+        applied_vert_indexes = []
 
-        cmds.setAttr("{0}.nw".format(self.skin_cluster), 0)
-        cmds.skinPercent(self.skin_cluster, selected_vertexes, prw=100, nrm=0)
+        # Dual-quarternion values get collected the same way so they're also set in one call.
+        blend_weights = om2.MDoubleArray(len(vert_indexes), 0.0)
 
-        if display_progress:
-            pbar = status_progress_bar.StatusProgressBar("Setting skin weights", len(vert_indexes))
-            pbar.start()
+        # Remember the skinCluster's normalize mode so it can be put back afterwards.
+        # Going through the plug keeps these toggles out of Maya's undo queue, since the tool handles its own undo.
+        normalize_plug = mfn_skin_cluster.findPlug("normalizeWeights", False)
+        normalize_mode = normalize_plug.asInt()
+        normalize_plug.setInt(0)
 
         try:
-            # Apply weights per vert
-            for vert_index in vert_indexes:
-                weight_list_attr = "{0}.weightList[{1}]".format(self.skin_cluster, vert_index)
-
-                for inf_name, weight_value in self.skin_data[vert_index]["weights"].items():
-                    index = inf_names.index(inf_name)
-                    weight_attr = ".weights[{0}]".format(inf_ids[index])
-                    cmds.setAttr("{0}{1}".format(weight_list_attr, weight_attr), weight_value)
+            if display_progress:
+                pbar = status_progress_bar.StatusProgressBar("Setting skin weights", len(vert_indexes))
+                pbar.start()
+
+            try:
+                for vert_index in vert_indexes:
+                    row = len(applied_vert_indexes)
+                    offset = row * inf_count
+
+                    # Look up the vertex once for both its weights and dual-quarternion value.
+                    vert_data = self.skin_data[vert_index]
+                    vert_weights = vert_data["weights"]
+
+                    if len(vert_weights) == 1:
+                        # Verts that are fully weighted to one influence are common, and don't need any summing.
+                        for inf_name, weight_value in vert_weights.items():
+                            if normalize and weight_value > 0:
+                                weight_value = 1.0
+                            weights[offset + inf_columns[inf_name]] = weight_value
+                    else:
+                        # Normalize here so only these verts need it rather than the whole skinCluster.
+                        scale = 1.0
+                        if normalize:
+                            total = sum(vert_weights.values())
+                            if total > 0:
+                                scale = 1.0 / total
+
+                        for inf_name, weight_value in vert_weights.items():
+                            weights[offset + inf_columns[inf_name]] = weight_value * scale
+
+                    # Apply dual-quarternions
+                    blend_weights[row] = vert_data["dq"]
+
+                    applied_vert_indexes.append(vert_index)
+
+                    if display_progress:
+                        if pbar.was_cancelled():
+                            break
+                        pbar.next()
+            finally:
+                if display_progress:
+                    pbar.end()
 
-                # Apply dual-quarternions
-                dq_value = self.skin_data[vert_index]["dq"]
-                cmds.setAttr("{0}.bw[{1}]".format(self.skin_cluster, vert_index), dq_value)
+            if applied_vert_indexes:
+                weights.setLength(len(applied_vert_indexes) * inf_count)
+                blend_weights.setLength(len(applied_vert_indexes))
 
-                if display_progress:
-                    if pbar.was_cancelled():
-                        break
-                    pbar.next()
-        finally:
-            if display_progress:
-                pbar.end()
+                components = self._create_components(applied_vert_indexes, shape_dag_path)
 
-        # Re-enable weights normalizing
-        cmds.setAttr("{0}.nw".format(self.skin_cluster), 1)
+                mfn_skin_cluster.setWeights(
+                    shape_dag_path,
+                    components,
+                    om2.MIntArray(list(range(inf_count))),
+                    weights,
+                    False)
 
-        if normalize:
-            cmds.skinCluster(self.skin_cluster, e=True, forceNormalizeWeights=True)
+                mfn_skin_cluster.setBlendWeights(shape_dag_path, components, blend_weights)
+        finally:
+            # Restore weights normalizing, even if something failed so the skinCluster isn't left without it.
+            normalize_plug.setInt(normalize_mode)
 
     def serialize(self):
         if not self.has_valid_skin():
             raise RuntimeError("Unable to detect a skinCluster on '{}'.".format(self.name))
 
-        skin_data = self.skin_data.copy()
+        # Weights get rebuilt below, so a shallow copy of each vertex is enough instead of copying everything.
+        skin_data = self.skin_data.data
+        verts_data = {}
+
         mesh_points = self._get_world_points()
 
         with status_progress_bar.StatusProgressBar("Saving vert positions", len(mesh_points)) as pbar:
             for vert_index, pnt in enumerate(mesh_points):
-                skin_data[vert_index]["world_pos"] = [pnt.x, pnt.y, pnt.z]
+                vert_data = skin_data[vert_index].copy()
+                vert_data["world_pos"] = [pnt.x, pnt.y, pnt.z]
+                verts_data[vert_index] = vert_data
+
+                # No need to write out weights that are effectively zero.
+                vert_data["weights"] = {
+                    inf: weight
+                    for inf, weight in vert_data["weights"].items()
+                    if not utils.is_close(0.0, weight)
+                }
 
                 if pbar.was_cancelled():
                     raise RuntimeError("User cancelled")
@@ -667,13 +986,19 @@ class SkinnedObj:
                 pbar.next()
 
         influence_data = {}
-        influence_ids = self.get_influence_ids()
 
-        with status_progress_bar.StatusProgressBar("Saving influence positions", len(influence_ids)) as pbar:
-            for inf_id, inf in influence_ids.items():
+        # Get world matrices and attributes straight from the nodes instead of querying each one.
+        mfn_skin_cluster = self._get_mfn_skin_cluster()
+        inf_dag_paths = mfn_skin_cluster.influenceObjects()
+
+        with status_progress_bar.StatusProgressBar("Saving influence positions", len(inf_dag_paths)) as pbar:
+            for inf_dag_path in inf_dag_paths:
+                inf_id = int(mfn_skin_cluster.indexForInfluenceObject(inf_dag_path))
+                world_matrix = inf_dag_path.inclusiveMatrix()
+
                 influence_data[inf_id] = {
-                    "name": inf,
-                    "world_matrix": cmds.xform(inf, q=True, ws=True, m=True)
+                    "name": inf_dag_path.partialPathName(),
+                    "world_matrix": [world_matrix[i] for i in range(16)]
                 }
 
                 if pbar.was_cancelled():
@@ -684,19 +1009,19 @@ class SkinnedObj:
         return {
             "version": constants.EXPORT_VERSION,
             "object": self.name,
-            "verts": skin_data.data,
+            "verts": verts_data,
             "influences": influence_data,
             "skin_cluster": {
                 "name": self.skin_cluster,
-                "vert_count": cmds.polyEvaluate(self.name, vertex=True),
-                "influence_count": len(influence_ids),
-                "max_influences": cmds.getAttr("{}.maxInfluences".format(self.skin_cluster)),
-                "skinning_method": cmds.getAttr("{}.skinningMethod".format(self.skin_cluster)),
-                "dqs_support_non_rigid": cmds.getAttr("{}.dqsSupportNonRigid".format(self.skin_cluster))
+                "vert_count": len(mesh_points),
+                "influence_count": len(influence_data),
+                "max_influences": mfn_skin_cluster.findPlug("maxInfluences", False).asInt(),
+                "skinning_method": mfn_skin_cluster.findPlug("skinningMethod", False).asInt(),
+                "dqs_support_non_rigid": mfn_skin_cluster.findPlug("dqsSupportNonRigid", False).asBool()
             }
         }
 
-    def import_skin(self, file_path=None, world_space=False, create_missing_infs=True):
+    def import_skin(self, file_path=None, world_space=False, create_missing_infs=True, normalize=False, skin_data=None):
         """
         Imports skin weights from a file.
 
@@ -704,46 +1029,56 @@ class SkinnedObj:
             file_path(string): An absolute path to save weights to.
             world_space(bool): False=loads by point order, True=loads by world positions
             create_missing_infs(bool): Create any missing influences so the skin can still import.
+            normalize(bool): Normalizes the file's weights as they're applied. Can be skipped if they're already normalized.
+            skin_data(dict): The file's contents if it was already loaded, so it doesn't need to be read again.
         """
         if not self.is_valid():
             raise RuntimeError("Need to pick an object first.")
 
-        if file_path is None:
+        if file_path is None and skin_data is None:
             file_path = self._launch_file_picker(1, "Import skin", ok_caption="Import")
             if not file_path:
                 return False
 
-        vert_filter = utils.extract_indexes(
-            utils.get_vert_indexes(self.name))
+        # Use a set since every vertex gets checked against it.
+        vert_filter = set(utils.extract_indexes(
+            utils.get_vert_indexes(self.name)))
 
         # Must have an existing skin cluster if we're only applying on some vertexes.
         if vert_filter:
             if not self.has_valid_skin():
                 raise RuntimeError("A skinCluster must already exist when importing weights onto vertexes")
 
-        with open(file_path, "rb") as f:
-            skin_data = cPickle.loads(f.read())
+        if skin_data is None:
+            skin_data = self._read_skin_file(file_path)
 
-            # Keys need to be converted to ints.
-            skin_data["verts"] = {
-                int(key): value
-                for key, value in skin_data["verts"].items()
-            }
+        # Rename influences to match scene, resolving each unique name only once.
+        old_names = set()
+        for vert_data in skin_data["verts"].values():
+            old_names.update(vert_data["weights"])
 
-        # Rename influences to match scene.
-        with status_progress_bar.StatusProgressBar("Matching influences", len(skin_data["verts"])) as pbar:
-            infs = {}
+        # Resolve the file's influences all at once since they're needed again below.
+        resolved_infs = self._resolve_influences(
+            old_names.union(inf_data["name"] for inf_data in skin_data["influences"].values()))
 
-            for index in skin_data["verts"]:
-                for old_name in list(skin_data["verts"][index]["weights"]):
-                    if old_name not in infs:
-                        infs[old_name] = self._find_influence_by_name(old_name) or old_name.split("|")[-1]
-                    skin_data["verts"][index]["weights"][infs[old_name]] = skin_data["verts"][index]["weights"].pop(old_name)
+        infs = {
+            old_name: resolved_infs[old_name] or old_name.split("|")[-1]
+            for old_name in old_names
+        }
 
-                if pbar.was_cancelled():
-                    raise RuntimeError("User cancelled")
+        # Only rebuild the weights when a name actually changed.
+        if any(old_name != new_name for old_name, new_name in infs.items()):
+            with status_progress_bar.StatusProgressBar("Matching influences", len(skin_data["verts"])) as pbar:
+                for vert_data in skin_data["verts"].values():
+                    vert_data["weights"] = {
+                        infs[old_name]: weight
+                        for old_name, weight in vert_data["weights"].items()
+                    }
 
-                pbar.next()
+                    if pbar.was_cancelled():
+                        raise RuntimeError("User cancelled")
+
+                    pbar.next()
 
         if world_space:
             closest_vertexes = self._map_to_closest_vertexes(skin_data["verts"], vert_filter)
@@ -755,7 +1090,7 @@ class SkinnedObj:
         else:
             # Bail if vert count with file and object don't match (import via point order only)
             file_vert_count = skin_data["skin_cluster"]["vert_count"]
-            obj_vert_count = cmds.polyEvaluate(self.name, vertex=True)
+            obj_vert_count = utils.get_vert_count(self.name)
             if file_vert_count != obj_vert_count:
                 raise RuntimeError("Vert count doesn't match. (Object: {}, File: {})".format(obj_vert_count, file_vert_count))
             weights_data = skin_data["verts"]
@@ -763,10 +1098,13 @@ class SkinnedObj:
         # Get influences from file
         skin_jnts = []
 
+        # Names were resolved before any joints get created, so track them to avoid duplicates.
+        created_infs = {}
+
         for inf_id, inf_data in skin_data["influences"].items():
             inf_name = inf_data["name"]
             inf_short_name = inf_name.split("|")[-1]
-            inf = self._find_influence_by_name(inf_name)
+            inf = resolved_infs[inf_name] or created_infs.get(inf_short_name)
 
             if inf is None:
                 if not create_missing_infs:
@@ -776,6 +1114,7 @@ class SkinnedObj:
                 inf = cmds.createNode("joint", name=inf_short_name, skipSelect=True)
                 cmds.xform(inf, ws=True, m=inf_data["world_matrix"])
                 OpenMaya.MGlobal.displayWarning("Created '{}' because it was missing.".format(inf_short_name))
+                created_infs[inf_short_name] = inf
 
             skin_jnts.append(inf)
 
@@ -799,6 +1138,8 @@ class SkinnedObj:
                 dqs_support_non_rigid=skin_data["skin_cluster"]["dqs_support_non_rigid"],
                 name=skin_data["skin_cluster"]["name"])
 
+        self.invalidate_influence_cache()
+
         # Define all verts to apply weights to.
         vert_indexes = [
             vert_index
@@ -806,10 +1147,11 @@ class SkinnedObj:
             if not vert_filter or vert_index in vert_filter
         ]
 
-        self.skin_data.data = weights_data
+        # Replace the data directly so the old weights never need to be collected.
+        self.skin_data = SkinData(weights_data)
         self.collect_influence_colors()
-        self.infs = self.get_all_infs()
-        self.apply_current_skin_weights(vert_indexes, display_progress=True)
+        self.update_infs()
+        self.apply_current_skin_weights(vert_indexes, normalize=normalize, display_progress=True)
 
         return True
 
@@ -831,14 +1173,7 @@ class SkinnedObj:
             if not file_path:
                 return
 
-        skin_data = self.serialize()
-
-        output_dir = os.path.dirname(file_path)
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-
-        with open(file_path, "wb") as f:
-            f.write(cPickle.dumps(skin_data))
+        self._write_skin_file(file_path, self.serialize())
 
         return file_path
 
@@ -861,20 +1196,34 @@ class SkinnedObj:
             OpenMaya.MGlobal.displayWarning("There are no skinClusters in the scene to export.")
             return
 
-        for skin_cluster in skin_clusters:
-            meshes = cmds.ls(cmds.listHistory(skin_cluster) or [], type="mesh")
-            if not meshes:
-                continue
+        # Maya calls have to stay on the main thread, so only the pickling and writing is handed off.
+        # That way the next skin can be serialized while the last one is still being written.
+        pool = ThreadPool(min(len(skin_clusters), 4))
 
-            transform = cmds.listRelatives(meshes[0], parent=True)[0]
-            export_path = "{}/{}.skin".format(export_folder, transform)
-            skinned_obj = cls.create(transform)
-            skinned_obj.export_skin(export_path)
-            if delete_skin_cluster:
-                cmds.delete(transform, ch=True)
+        try:
+            results = []
+
+            for skin_cluster in skin_clusters:
+                meshes = cmds.ls(cmds.listHistory(skin_cluster) or [], type="mesh")
+                if not meshes:
+                    continue
+
+                transform = cmds.listRelatives(meshes[0], parent=True)[0]
+                export_path = "{}/{}.skin".format(export_folder, transform)
+                skinned_obj = cls.create(transform)
+                results.append(pool.apply_async(cls._write_skin_file, (export_path, skinned_obj.serialize())))
+                if delete_skin_cluster:
+                    cmds.delete(transform, ch=True)
+
+            # Re-raises any error that happened while writing.
+            for result in results:
+                result.get()
+        finally:
+            pool.close()
+            pool.join()
 
     @classmethod
-    def import_all_skins(cls, world_space, create_missing_infs, import_folder=None):
+    def import_all_skins(cls, world_space, create_missing_infs, import_folder=None, normalize=False):
         """
         Fetches all skin files from the supplied folder and tries to import them all into the scene.
         It tries to load by name using the skin's file name.
@@ -883,6 +1232,7 @@ class SkinnedObj:
             world_space(bool): False=loads by point order, True=loads by world positions
             create_missing_infs(bool): Create any missing influences so the skin can still import.
             import_folder(string): An absolute path to a folder that contains skin files.
+            normalize(bool): Normalizes each file's weights as they're applied.
         """
         if import_folder is None:
             import_folder = cls._launch_file_picker(3, "Pick a folder with skin files to import them", ok_caption="Import")
@@ -894,11 +1244,30 @@ class SkinnedObj:
             OpenMaya.MGlobal.displayWarning("The folder contains no skin files to import with.")
             return
 
+        skin_paths = []
+
         for skin_path in skin_files:
             transform = os.path.basename(skin_path).split(".")[0]
             if not cmds.objExists(transform):
                 OpenMaya.MGlobal.displayWarning("Unable to find the object to import weights onto: `{0}`".format(transform))
                 continue
 
-            skinned_obj = SkinnedObj.create(transform)
-            skinned_obj.import_skin(file_path=skin_path, world_space=world_space, create_missing_infs=create_missing_infs)
+            skin_paths.append((transform, skin_path))
+
+        if not skin_paths:
+            return
+
+        # Files are read in the background while the main thread applies the ones that are already loaded.
+        pool = ThreadPool(min(len(skin_paths), 4))
+
+        try:
+            loaded_skins = pool.imap(cls._read_skin_file, [skin_path for _, skin_path in skin_paths])
+
+            for (transform, skin_path), skin_data in zip(skin_paths, loaded_skins):
+                skinned_obj = SkinnedObj.create(transform)
+                skinned_obj.import_skin(
+                    file_path=skin_path, world_space=world_space, create_missing_infs=create_missing_infs,
+                    normalize=normalize, skin_data=skin_data)
+        finally:
+            pool.close()
+            pool.join()
@@ -1,6 +1,8 @@
 EXPORT_VERSION = 1.0
 COLOR_SET = "weightsEditorCreateColorSet"
 POLY_COLOR_PER_VERT = "weightsEditorPolyColorPerVertex"
+MAX_NEIGHBOURS_PRECACHE_VERTS = 50000
+MAX_LINEAR_CLOSEST_INFS = 48
 GITHUB_HOME = "https://github.com/theRussetPotato/weights_editor"
 GITHUB_ISSUES = GITHUB_HOME + "/issues"
 GITHUB_LATEST_RELEASE = "https://api.github.com/repos/theRussetPotato/weights_editor/releases/latest"
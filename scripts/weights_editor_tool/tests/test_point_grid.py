@@ -0,0 +1,51 @@
+import random
+
+from unittest import TestCase
+
+from weights_editor_tool.classes.point_grid import PointGrid
+
+
+class TestPointGrid(TestCase):
+
+    @staticmethod
+    def _find_closest_brute_force(points, point):
+        dists = [
+            sum((a - b) ** 2 for a, b in zip(other, point))
+            for other in points
+        ]
+        return dists.index(min(dists))
+
+    def _validate_closest(self, points, queries):
+        point_grid = PointGrid(points)
+
+        for point in queries:
+            closest_index = point_grid.find_closest(point)
+            expected_index = self._find_closest_brute_force(points, point)
+
+            # Compare distances in case of ties.
+            self.assertAlmostEqual(
+                sum((a - b) ** 2 for a, b in zip(points[closest_index], point)),
+                sum((a - b) ** 2 for a, b in zip(points[expected_index], point)))
+
+    def test_empty(self):
+        self.assertIsNone(PointGrid([]).find_closest((0, 0, 0)))
+
+    def test_random_points(self):
+        rand = random.Random(0)
+        points = [[rand.uniform(-10, 10) for _ in range(3)] for _ in range(500)]
+        queries = [[rand.uniform(-15, 15) for _ in range(3)] for _ in range(200)]
+        self._validate_closest(points, queries)
+
+    def test_nearly_flat_points(self):
+        # Like a joint chain that's not perfectly straight.
+        rand = random.Random(0)
+        points = [
+            [i + rand.uniform(-1e-5, 1e-5), rand.uniform(-1e-5, 1e-5), rand.uniform(-1e-5, 1e-5)]
+            for i in range(20)
+        ]
+
+        point_grid = PointGrid(points)
+        self.assertGreater(point_grid._cell_size, 0.1)
+
+        queries = [[rand.uniform(-5, 25) for _ in range(3)] for _ in range(200)]
+        self._validate_closest(points, queries)
@@ -15,7 +15,6 @@ Example of usage:
 """
 
 import os
-import copy
 import json
 import traceback
 import shiboken2
@@ -35,6 +34,7 @@ from weights_editor_tool import constants
 from weights_editor_tool.enums import ColorTheme, WeightOperation, SmoothOperation, Hotkeys
 from weights_editor_tool import weights_editor_utils as utils
 from weights_editor_tool.classes.skinned_obj import SkinnedObj
+from weights_editor_tool.classes.skin_data import SkinData
 from weights_editor_tool.classes import hotkey as hotkey_module
 from weights_editor_tool.classes import command_edit_weights
 from weights_editor_tool.classes import command_lock_infs
@@ -83,7 +83,7 @@ class WeightsEditor(QtWidgets.QWidget):
         self.color_inf = None
         self.vert_indexes = []
         self.locks = []
-        self.toggle_inf_lock_key_codes = []
+        self.toggle_inf_lock_key_codes = set()
         self.color_style = ColorTheme.Max
 
         self._create_gui()
@@ -912,11 +912,11 @@ class WeightsEditor(QtWidgets.QWidget):
         Installs temporary hotkeys that overrides Maya's.
         """
         self._remove_shortcuts()
-        self.toggle_inf_lock_key_codes = []
+        self.toggle_inf_lock_key_codes = set()
 
         for hotkey in self._hotkeys:
             if hotkey.caption == Hotkeys.ToggleInfLock or hotkey.caption == Hotkeys.ToggleInfLock2:
-                self.toggle_inf_lock_key_codes.append(hotkey.key_code())
+                self.toggle_inf_lock_key_codes.add(int(hotkey.key_code()))
             else:
                 shortcut = utils.create_shortcut(
                     QtGui.QKeySequence(hotkey.key_code()), hotkey.func)
@@ -1157,6 +1157,10 @@ class WeightsEditor(QtWidgets.QWidget):
             cmds.getAttr("{0}.lockInfluenceWeights".format(inf_name))
             for inf_name in self.obj.infs
         ]
+
+        # Nothing to clear if the weights weren't collected yet, so don't force it.
+        if self.obj.is_skin_data_loaded():
+            self.obj.skin_data.clear_lock_cache()
     
     def _get_infs_by_selected_verts(self):
         """
@@ -1240,6 +1244,9 @@ class WeightsEditor(QtWidgets.QWidget):
         sel_vert_indexes = set()
         old_skin_data = self.obj.skin_data.copy()
 
+        # Locks may have been changed outside the tool since the last edit.
+        self.obj.skin_data.clear_lock_cache()
+
         for vert_index, inf in verts_and_infs:
             old_value, new_value = self.obj.skin_data.calculate_new_value(input_value, vert_index, inf, weight_operation)
             if utils.is_close(old_value, new_value):  # Skip it if the new value is too similar.
@@ -1403,8 +1410,8 @@ class WeightsEditor(QtWidgets.QWidget):
             vert_indexes = utils.extract_indexes(
                 utils.get_vert_indexes(self.obj.name))
         else:
-            vert_indexes = utils.extract_indexes(
-                utils.get_all_vert_indexes(self.obj.name))
+            # Indexes are contiguous, so there's no need to list and parse every vertex.
+            vert_indexes = list(range(utils.get_vert_count(self.obj.name)))
 
         mirror_mode = self._mirror_mode.currentText().lstrip("-")
         mirror_inverse = self._mirror_mode.currentText().startswith("-")
@@ -1436,7 +1443,7 @@ class WeightsEditor(QtWidgets.QWidget):
 
         self._recollect_table_data(update_verts=False)
 
-        vert_filter = vert_indexes if selection_only else []
+        vert_filter = vert_indexes if selection_only else None
         self.update_vert_colors(vert_filter=vert_filter)
 
         new_skin_data = self.obj.skin_data.copy()
@@ -1481,7 +1488,7 @@ class WeightsEditor(QtWidgets.QWidget):
         )
 
         if infs:
-            inf_index = self.obj.infs.index(infs[-1])
+            inf_index = self.obj.inf_indexes[infs[-1]]
             do_lock = not self.locks[inf_index]
             self.toggle_inf_locks(infs, do_lock)
 
@@ -1548,7 +1555,7 @@ class WeightsEditor(QtWidgets.QWidget):
             self._limit_warning_label.setVisible(over_limit)
 
     def _weights_view_on_key_pressed(self, event):
-        key_code = event.key() | event.modifiers()
+        key_code = int(event.key() | event.modifiers())
         if key_code in self.toggle_inf_lock_key_codes:
             self._toggle_selected_inf_locks()
         else:
@@ -1731,7 +1738,7 @@ class WeightsEditor(QtWidgets.QWidget):
                 return
 
         for vert_index in vert_indexes:
-            self.obj.skin_data[vert_index] = copy.deepcopy(self._copied_vertex)
+            self.obj.skin_data[vert_index] = SkinData.copy_vertex_data(self._copied_vertex)
 
         new_skin_data = self.obj.skin_data.copy()
 
@@ -1838,8 +1845,7 @@ class WeightsEditor(QtWidgets.QWidget):
         weights_view = self.get_active_weights_view()
         table_selection = weights_view.save_table_selection()
 
-        vert_indexes = utils.extract_indexes(
-            utils.get_all_vert_indexes(self.obj.name))
+        vert_indexes = list(range(utils.get_vert_count(self.obj.name)))
 
         self.obj.flood_weights_to_closest()
 
@@ -1962,11 +1968,11 @@ class WeightsEditor(QtWidgets.QWidget):
             self.update_vert_colors()
 
     def _inf_list_on_toggle_locks_triggered(self, infs):
-        if infs[0] not in self.obj.infs:
+        inf_index = self.obj.inf_indexes.get(infs[0])
+        if inf_index is None:
             OpenMaya.MGlobal.displayError("Unable to find influence in internal data.. Is it out of sync?")
             return
 
-        inf_index = self.obj.infs.index(infs[0])
         lock = not self.locks[inf_index]
         self.toggle_inf_locks(infs, lock)
 
@@ -2006,6 +2012,9 @@ class WeightsEditor(QtWidgets.QWidget):
 
         weights_view = self.get_active_weights_view()
         table_selection = weights_view.save_table_selection()
+
+        # Locks may have been changed outside the tool since the last edit.
+        self.obj.skin_data.clear_lock_cache()
         
         # Add infs by setting a very low value so it doesn't effect other weights too much.
         for inf in sel_infs:
@@ -2099,7 +2108,7 @@ class WeightsEditor(QtWidgets.QWidget):
 
         return True
 
-    def update_vert_colors(self, vert_filter=[]):
+    def update_vert_colors(self, vert_filter=None):
         """
         Displays active influence.
 
@@ -6,7 +6,8 @@ from maya import cmds
 from maya import mel
 from maya import OpenMaya
 from maya import OpenMayaUI
-from maya import OpenMayaAnim
+from maya.api import OpenMaya as om2
+from maya.api import OpenMayaAnim as oma2
 
 from PySide2 import QtCore
 from PySide2 import QtGui
@@ -230,14 +231,45 @@ def extract_indexes(flatten_list):
     ]
 
 
-def get_all_vert_indexes(obj):
+def get_index_ranges(indexes):
     """
-    Gets and returns all vertexes from the supplied object.
+    Groups indexes into runs of consecutive numbers.
+
+    Args:
+        indexes(int[]): A list of indexes, in any order.
+
+    Returns:
+        A list of (start, end) tuples, where both ends are inclusive.
     """
-    if is_curve(obj):
-        return cmds.ls("{0}.cv[*]".format(obj), long=True, flatten=True)
-    else:
-        return cmds.ls("{0}.vtx[*]".format(obj), long=True, flatten=True)
+    ranges = []
+
+    for index in sorted(set(indexes)):
+        if ranges and ranges[-1][1] == index - 1:
+            ranges[-1][1] = index
+        else:
+            ranges.append([index, index])
+
+    return [tuple(index_range) for index_range in ranges]
+
+
+def get_component_ranges(obj, indexes, component="vtx"):
+    """
+    Builds component names with consecutive indexes collapsed, so Maya has less to parse.
+
+    Args:
+        obj(string)
+        indexes(int[]): A list of component indexes.
+        component(string): The component's type, like vtx or cv.
+
+    Returns:
+        A list of strings. ["obj.vtx[0:5]", "obj.vtx[8]", ..]
+    """
+    return [
+        "{0}.{1}[{2}]".format(obj, component, start)
+        if start == end else
+        "{0}.{1}[{2}:{3}]".format(obj, component, start, end)
+        for start, end in get_index_ranges(indexes)
+    ]
 
 
 def get_vert_indexes(obj):
@@ -312,17 +344,15 @@ def get_influence_ids(skin_cluster):
     if not has_infs:
         return {}
 
-    skin_cluster_mobj = to_mobject(skin_cluster)
-    mfn_skin_cluster = OpenMayaAnim.MFnSkinCluster(skin_cluster_mobj)
-
-    inf_mdag_paths = OpenMaya.MDagPathArray()
-    mfn_skin_cluster.influenceObjects(inf_mdag_paths)
+    msel_list = om2.MSelectionList()
+    msel_list.add(skin_cluster)
+    mfn_skin_cluster = oma2.MFnSkinCluster(msel_list.getDependNode(0))
 
     inf_ids = {}
 
-    for i in range(inf_mdag_paths.length()):
-        inf_id = int(mfn_skin_cluster.indexForInfluenceObject(inf_mdag_paths[i]))
-        inf_ids[inf_id] = inf_mdag_paths[i].partialPathName()
+    for inf_mdag_path in mfn_skin_cluster.influenceObjects():
+        inf_id = int(mfn_skin_cluster.indexForInfluenceObject(inf_mdag_path))
+        inf_ids[inf_id] = inf_mdag_path.partialPathName()
 
     return inf_ids
 
@@ -372,6 +402,44 @@ def get_weight_color(weight, start_color=[0, 0, 1], mid_color=[0, 1, 0], end_col
     return [r, g, b]
 
 
+def get_weight_colors(weights, start_color, mid_color, end_color, full_color, no_color):
+    """
+    Same as get_weight_color but for many weights at once, so the ramp's deltas are only calculated once.
+
+    Args:
+        weights(float[]): Values between 0.0 to 1.0. Use None if there's no weight.
+        start_color(float[]): Represents rbg when weight is 0.0.
+        mid_color(float[]): Represents rbg when weight is 0.5.
+        end_color(float[]): Represents rbg when weight is 1.0.
+        full_color(float[]): Represents rbg when weight is equal to 1.0.
+        no_color(float[]): Represents rbg when weight is None.
+
+    Returns:
+        A list of rbg lists.
+    """
+    start_r, start_g, start_b = start_color
+    mid_r, mid_g, mid_b = mid_color
+
+    low_r, low_g, low_b = [mid_color[i] - start_color[i] for i in range(3)]
+    high_r, high_g, high_b = [end_color[i] - mid_color[i] for i in range(3)]
+
+    colors = []
+
+    for weight in weights:
+        if weight is None:
+            colors.append(no_color)
+        elif weight == 1.0:
+            colors.append(full_color)
+        elif weight < 0.5:
+            w = weight * 2
+            colors.append([start_r + w * low_r, start_g + w * low_g, start_b + w * low_b])
+        else:
+            w = (weight - 0.5) * 2
+            colors.append([mid_r + w * high_r, mid_g + w * high_g, mid_b + w * high_b])
+
+    return colors
+
+
 def apply_vert_colors(obj, colors, vert_indexes):
     """
     Sets vert colors on the supplied mesh.
@@ -409,36 +477,6 @@ def apply_vert_colors(obj, colors, vert_indexes):
         cmds.rename(dif_pcolor[0], constants.POLY_COLOR_PER_VERT)
 
 
-def get_vert_neighbours(obj, vert_index):
-    """
-    Fetches adjacent vertexes.
-    
-    Args:
-        obj(string)
-        vert_index(int)
-    
-    Returns:
-        A list of vertex indexes.
-    """
-    if is_curve(obj):
-        return []
-    
-    # Get surrounding edges
-    edge_string = cmds.polyInfo("{0}.vtx[{1}]".format(obj, vert_index), vertexToEdge=True)[0]
-    edge_indexes = edge_string.split()[2:]
-    
-    # Convert edges back to vertexes
-    neighbours = set()
-
-    for edge_index in edge_indexes:
-        vert_string = cmds.polyInfo("{0}.e[{1}]".format(obj, edge_index), edgeToVertex=True)[0]
-        for v in vert_string.split()[2:]:
-            if v.isdigit():
-                neighbours.add(int(v))
-
-    return list(neighbours)
-
-
 def br_smooth_verts(flood=1.0, ignore_lock=True):
     last_ctx = cmds.currentCtx()
 
@@ -27,6 +27,9 @@ class AbstractWeightsView(QtWidgets.QTableView):
 
         self._orientation = header_orientation
         self._font = QtGui.QFont(system_font.family(), system_font.pixelSize())
+        self._empty_text_color = QtGui.QColor(255, 255, 255)
+        self._empty_pixmaps = {}  # {file_name: QPixmap}
+        self._header_qcolors = {}  # {(r, g, b): QColor}
         self._editor_inst = editor_inst
         self._old_skin_data = None  # Need to store this to work with undo/redo.
         self.table_model = None
@@ -113,17 +116,17 @@ class AbstractWeightsView(QtWidgets.QTableView):
         """
         Shows tooltip when table is empty.
         """
-        if self.model().rowCount(self) == 0:
+        if self.table_model.is_empty():
             if not self._editor_inst.obj.is_valid():
                 msg = ("Select a skinned object and push\n"
                        "the button on top edit its weights.")
-                img = utils.load_pixmap("table_view/select_skin.png")
+                img = self._get_empty_pixmap("table_view/select_skin.png")
             elif not self._editor_inst.obj.has_valid_skin():
                 msg = "Unable to detect a skinCluster on this object."
-                img = utils.load_pixmap("table_view/sad.png")
+                img = self._get_empty_pixmap("table_view/sad.png")
             else:
                 msg = "Select the object's components to edit it."
-                img = utils.load_pixmap("table_view/select_points.png")
+                img = self._get_empty_pixmap("table_view/select_points.png")
             
             qp = QtGui.QPainter(self.viewport())
             if not qp.isActive():
@@ -138,13 +141,23 @@ class AbstractWeightsView(QtWidgets.QTableView):
             rect = paint_event.rect()
             rect.setTop(self.height() / 2)
 
-            qp.setPen(QtGui.QColor(255, 255, 255))
+            qp.setPen(self._empty_text_color)
             qp.setFont(self._font)
             qp.drawText(rect, QtCore.Qt.AlignHCenter | QtCore.Qt.AlignTop, msg)
             qp.end()
         
         QtWidgets.QTableView.paintEvent(self, paint_event)
 
+    def _get_empty_pixmap(self, file_name):
+        """
+        Loads an image for the empty table once instead of on every repaint.
+        """
+        pixmap = self._empty_pixmaps.get(file_name)
+        if pixmap is None:
+            pixmap = utils.load_pixmap(file_name)
+            self._empty_pixmaps[file_name] = pixmap
+        return pixmap
+
     def keyPressEvent(self, event):
         self.key_pressed.emit(event)
     
@@ -153,10 +166,27 @@ class AbstractWeightsView(QtWidgets.QTableView):
 
         # Begins edit on current cell.
         if event.button() == QtCore.Qt.MouseButton.RightButton:
+            # Locks may have been changed outside the tool since the last edit.
+            self._editor_inst.obj.skin_data.clear_lock_cache()
+
             # Save this prior to any changes.
-            self._old_skin_data = self._editor_inst.obj.skin_data.copy()
+            self._old_skin_data = self._copy_skin_data(self._editor_inst.vert_indexes)
             self.edit(self.currentIndex())
 
+    def _copy_skin_data(self, vert_indexes):
+        """
+        Copies skin data for undo, limited to the vertexes the view can edit instead of the whole mesh.
+
+        Returns:
+            A dictionary of {vert_index: vert_data}
+        """
+        skin_data = self._editor_inst.obj.skin_data
+
+        return {
+            vert_index: skin_data.copy_vertex(vert_index)
+            for vert_index in vert_indexes
+        }
+
     def _get_last_clicked_inf(self):
         return self.table_model.display_infs[self._header.last_index]
 
@@ -236,7 +266,12 @@ class AbstractWeightsView(QtWidgets.QTableView):
 
                 color = None
                 if rgb is not None:
-                    color = QtGui.QColor.fromRgbF(*rgb)
+                    # Influence colors rarely change, so reuse colors between refreshes.
+                    rgb = tuple(rgb)
+                    color = self._header_qcolors.get(rgb)
+                    if color is None:
+                        color = QtGui.QColor.fromRgbF(*rgb)
+                        self._header_qcolors[rgb] = color
                 self.table_model.header_colors.append(color)
 
     def toggle_long_names(self, hidden):
@@ -266,12 +301,18 @@ class AbstractModel(QtCore.QAbstractTableModel):
         self.input_value = None  # Used to properly set multiple cells
         self.hide_long_names = True
 
+        # {weight_value: display_text}
+        self._display_text_cache = {}
+
     def rowCount(self, parent):
         raise NotImplementedError
 
     def columnCount(self, parent):
         raise NotImplementedError
 
+    def is_empty(self):
+        raise NotImplementedError
+
     def data(self, index, role):
         raise NotImplementedError
 
@@ -286,3 +327,24 @@ class AbstractModel(QtCore.QAbstractTableModel):
 
     def get_inf(self, index):
         return self.display_infs[index]
+
+    def get_display_text(self, value):
+        """
+        Formats a weight value for its cell.
+        The text only depends on the value, so it's cached since cells are re-drawn all the time.
+        """
+        text = self._display_text_cache.get(value)
+
+        if text is None:
+            # Don't let it grow forever while lots of different weights are browsed.
+            if len(self._display_text_cache) > 10000:
+                self._display_text_cache.clear()
+
+            if value != 0 and value < 0.001:
+                text = "< 0.001"
+            else:
+                text = "{0:.3f}".format(value)
+
+            self._display_text_cache[value] = text
+
+        return text
@@ -9,6 +9,8 @@ class CustomDoubleSpinbox(QtWidgets.QDoubleSpinBox):
     """
     
     enter_pressed = QtCore.Signal(float)
+
+    EnterKeys = frozenset([QtCore.Qt.Key_Enter, QtCore.Qt.Key_Return])
     
     def __init__(self, parent=None):
         super(CustomDoubleSpinbox, self).__init__(parent)
@@ -16,6 +18,5 @@ class CustomDoubleSpinbox(QtWidgets.QDoubleSpinBox):
     def keyPressEvent(self, event):
         QtWidgets.QDoubleSpinBox.keyPressEvent(self, event)
         
-        key_code = event.key()
-        if key_code == QtCore.Qt.Key_Enter or key_code == QtCore.Qt.Key_Return:
+        if event.key() in self.EnterKeys:
             self.enter_pressed.emit(self.value())
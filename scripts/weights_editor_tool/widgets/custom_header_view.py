@@ -16,16 +16,21 @@ class CustomHeaderView(QtWidgets.QHeaderView):
         super(CustomHeaderView, self).__init__(orientation, parent)
         self.last_index = 0
 
+        self._button_signals = {
+            QtCore.Qt.MouseButton.LeftButton: self.header_left_clicked,
+            QtCore.Qt.MouseButton.MiddleButton: self.header_middle_clicked,
+            QtCore.Qt.MouseButton.RightButton: self.header_right_clicked
+        }
+
     def mousePressEvent(self, event):
         index = self.logicalIndexAt(event.x(), event.y())
         self.last_index = index
-        
-        if event.button() == QtCore.Qt.MouseButton.LeftButton:
-            self.header_left_clicked.emit(index)
-        elif event.button() == QtCore.Qt.MouseButton.MiddleButton:
-            self.header_middle_clicked.emit(index)
-        elif event.button() == QtCore.Qt.MouseButton.RightButton:
-            self.header_right_clicked.emit(index)
+
+        # Nothing to emit if it was clicked past the last section.
+        if index >= 0:
+            signal = self._button_signals.get(event.button())
+            if signal is not None:
+                signal.emit(index)
         
         return QtWidgets.QHeaderView.mousePressEvent(self, event)
 
@@ -77,7 +77,7 @@ class InfListView(QtWidgets.QListView):
             self._display_current_inf()
     
     def keyPressEvent(self, event):
-        key_code = event.key() | event.modifiers()
+        key_code = int(event.key() | event.modifiers())
 
         if key_code in self.window().toggle_inf_lock_key_codes:
             infs = [
@@ -201,8 +201,6 @@ class InfListModel(QtGui.QStandardItemModel):
         self._active_inf_text_color = QtGui.QColor(QtCore.Qt.black)
     
     def data(self, index, role):
-        QtGui.QStandardItemModel.data(self, index, role)
-        
         if not index.isValid():
             return
 
@@ -220,8 +218,8 @@ class InfListModel(QtGui.QStandardItemModel):
                 return self._active_inf_back_color
         elif role == QtCore.Qt.ForegroundRole:
             # Show locked influences.
-            if inf_name in self._editor_inst.obj.infs:
-                inf_index = self._editor_inst.obj.infs.index(inf_name)
+            inf_index = self._editor_inst.obj.inf_indexes.get(inf_name)
+            if inf_index is not None:
                 if self._editor_inst.locks[inf_index]:
                     if inf_name == self._editor_inst.color_inf:
                         return self._active_inf_text_color
@@ -233,9 +231,9 @@ class InfListModel(QtGui.QStandardItemModel):
         elif role == QtCore.Qt.DecorationRole:
             icon = self._joint_icon
 
-            if inf_name in self._editor_inst.obj.infs:
-                # Show locked influence icons.
-                inf_index = self._editor_inst.obj.infs.index(inf_name)
+            # Show locked influence icons.
+            inf_index = self._editor_inst.obj.inf_indexes.get(inf_name)
+            if inf_index is not None:
                 if self._editor_inst.locks[inf_index]:
                     icon = self._lock_icon
 
@@ -23,10 +23,14 @@ class ListView(abstract_weights_view.AbstractWeightsView):
         Enables multiple cells to be set.
         """
         is_cancelled = (hint == QtWidgets.QAbstractItemDelegate.RevertModelCache)
+
+        # Only fetch these once since every call goes through Qt.
+        selected_indexes = self.selectedIndexes()
+        current_index = self.currentIndex()
         
         if not is_cancelled:
-            for index in self.selectedIndexes():
-                if index == self.currentIndex():
+            for index in selected_indexes:
+                if index == current_index:
                     continue
                 
                 self.model().setData(index, None, QtCore.Qt.EditRole)
@@ -40,7 +44,7 @@ class ListView(abstract_weights_view.AbstractWeightsView):
                 "Set skin weights",
                 self._editor_inst.obj.name,
                 self._old_skin_data,
-                self._editor_inst.obj.skin_data.copy(),
+                self._copy_skin_data(self._editor_inst.vert_indexes),
                 self._editor_inst.vert_indexes,
                 self.save_table_selection())
         
@@ -137,22 +141,28 @@ class ListView(abstract_weights_view.AbstractWeightsView):
         Args:
             selection_data(dict): See save method for data's structure.
         """
-        self.clearSelection()
         if not selection_data:
+            self.clearSelection()
             return
 
         selection_model = self.selectionModel()
         item_selection = QtCore.QItemSelection()
 
+        # Look up rows with a dict instead of searching the list for every influence.
+        inf_rows = {
+            inf: row
+            for row, inf in enumerate(self.table_model.display_infs)
+        }
+
         for inf, vert_indexes in selection_data.items():
-            if inf not in self.table_model.display_infs:
+            row = inf_rows.get(inf)
+            if row is None:
                 continue
-
-            row = self.table_model.display_infs.index(inf)
             index = self.model().index(row, 0)
             item_selection.append(QtCore.QItemSelectionRange(index, index))
 
-        selection_model.select(item_selection, QtCore.QItemSelectionModel.Select)
+        # Clear and select in one go so the selection only changes once.
+        selection_model.select(item_selection, QtCore.QItemSelectionModel.ClearAndSelect)
 
     def fit_headers_to_contents(self):
         width = 0
@@ -191,6 +201,9 @@ class ListModel(abstract_weights_view.AbstractModel):
         else:
             return 0
 
+    def is_empty(self):
+        return not self._editor_inst.vert_indexes or not self.display_infs
+
     def data(self, index, role):
         if not index.isValid():
             return
@@ -202,9 +215,8 @@ class ListModel(abstract_weights_view.AbstractModel):
             value = self.get_average_weight(inf)
             
             if role == QtCore.Qt.ForegroundRole:
-                inf_index = self._editor_inst.obj.infs.index(inf)
-                is_locked = self._editor_inst.locks[inf_index]
-                if is_locked:
+                inf_index = self._editor_inst.obj.inf_indexes.get(inf)
+                if inf_index is not None and self._editor_inst.locks[inf_index]:
                     return self._locked_text
 
                 if value != 0 and value < 0.001:
@@ -214,9 +226,7 @@ class ListModel(abstract_weights_view.AbstractModel):
                 elif value >= 0.999:
                     return self._full_weight_text
             else:
-                if value != 0 and value < 0.001:
-                    return "< 0.001"
-                return "{0:.3f}".format(value)
+                return self.get_display_text(value)
     
     def setData(self, index, value, role):
         """
@@ -235,11 +245,12 @@ class ListModel(abstract_weights_view.AbstractModel):
             return False
 
         if self.input_value is None:
-            if not value.replace(".", "").isdigit():
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
                 return False
-            
-            value = float(value)
-            if not value >= 0 and value <= 1:
+
+            if not (0.0 <= value <= 1.0):
                 return False
 
             self.input_value = value
@@ -264,9 +275,8 @@ class ListModel(abstract_weights_view.AbstractModel):
             if orientation == QtCore.Qt.Vertical:
                 inf_name = self.display_infs[index]
                 
-                if inf_name in self._editor_inst.obj.infs:
-                    inf_index = self._editor_inst.obj.infs.index(inf_name)
-                    
+                inf_index = self._editor_inst.obj.inf_indexes.get(inf_name)
+                if inf_index is not None:
                     is_locked = self._editor_inst.locks[inf_index]
                     if is_locked:
                         return self._header_locked_text
@@ -35,28 +35,35 @@ class TableView(abstract_weights_view.AbstractWeightsView):
         Enables multiple cells to be set.
         """
         is_cancelled = (hint == QtWidgets.QAbstractItemDelegate.RevertModelCache)
+
+        # Only fetch these once since every call goes through Qt.
+        selected_indexes = self.selectedIndexes()
+        current_index = self.currentIndex()
         
         if not is_cancelled:
-            for index in self.selectedIndexes():
-                if index == self.currentIndex():
-                    continue
-                
-                self.model().setData(index, None, QtCore.Qt.EditRole)
+            self.model().apply_input_value([
+                index
+                for index in selected_indexes
+                if index != current_index
+            ])
         
         QtWidgets.QTableView.closeEditor(self, editor, hint)
         
         if self.model().input_value is not None:
             self.model().input_value = None
             
-            vert_indexes = list(set(
-                self.model().get_vert_index(index.row())
-                for index in self.selectedIndexes()))
+            # Rows repeat across columns, so only resolve each row's vertex once.
+            rows = set(index.row() for index in selected_indexes)
+            vert_indexes = [
+                self.model().get_vert_index(row)
+                for row in rows
+            ]
             
             self._editor_inst.add_undo_command(
                 "Set skin weights",
                 self._editor_inst.obj.name,
                 self._old_skin_data,
-                self._editor_inst.obj.skin_data.copy(),
+                self._copy_skin_data(vert_indexes),
                 vert_indexes,
                 self.save_table_selection())
         
@@ -94,10 +101,12 @@ class TableView(abstract_weights_view.AbstractWeightsView):
             if utils.is_curve(self._editor_inst.obj.name):
                 component = "cv"
 
-            vertex_list = [
-                "{0}.{1}[{2}]".format(self._editor_inst.obj.name, component, self._editor_inst.vert_indexes[row])
-                for row in rows
-            ]
+            vert_indexes = self._editor_inst.vert_indexes
+
+            vertex_list = utils.get_component_ranges(
+                self._editor_inst.obj.name,
+                [vert_indexes[row] for row in rows],
+                component=component)
         else:
             vertex_list = []
 
@@ -199,29 +208,40 @@ class TableView(abstract_weights_view.AbstractWeightsView):
         Args:
             selection_data(dict): See save method for data's structure.
         """
-        self.clearSelection()
-
         if not selection_data:
+            self.clearSelection()
             return
 
         selection_model = self.selectionModel()
         item_selection = QtCore.QItemSelection()
 
+        # {vert_index: row}
+        vert_rows = {
+            vert_index: row
+            for row, vert_index in enumerate(self._editor_inst.vert_indexes)
+        }
+
+        # Look up columns with a dict instead of searching the list for every influence.
+        inf_columns = {
+            inf: column
+            for column, inf in enumerate(self.table_model.display_infs)
+        }
+
         for inf, vert_indexes in selection_data.items():
-            if inf not in self.table_model.display_infs:
+            column = inf_columns.get(inf)
+            if column is None:
                 continue
 
-            column = self.table_model.display_infs.index(inf)
-
             for vert_index in vert_indexes:
-                if vert_index not in self._editor_inst.vert_indexes:
+                row = vert_rows.get(vert_index)
+                if row is None:
                     continue
 
-                row = self._editor_inst.vert_indexes.index(vert_index)
                 index = self.model().index(row, column)
                 item_selection.append(QtCore.QItemSelectionRange(index, index))
 
-        selection_model.select(item_selection, QtCore.QItemSelectionModel.Select)
+        # Clear and select in one go so the selection only changes once.
+        selection_model.select(item_selection, QtCore.QItemSelectionModel.ClearAndSelect)
 
     def fit_headers_to_contents(self):
         for i in range(self.horizontalHeader().count()):
@@ -248,6 +268,9 @@ class TableModel(abstract_weights_view.AbstractModel):
         else:
             return 0
 
+    def is_empty(self):
+        return not self._editor_inst.vert_indexes
+
     def data(self, index, role):
         if not index.isValid():
             return
@@ -256,12 +279,12 @@ class TableModel(abstract_weights_view.AbstractModel):
 
         if role in roles:
             inf = self.get_inf(index.column())
-            value = self._get_value_by_index(index)
+            vert_index = self.get_vert_index(index.row())
+            value = self._get_value(vert_index, inf)
             
             if role == QtCore.Qt.ForegroundRole:
-                inf_index = self._editor_inst.obj.infs.index(inf)
-                is_locked = self._editor_inst.locks[inf_index]
-                if is_locked:
+                inf_index = self._editor_inst.obj.inf_indexes.get(inf)
+                if inf_index is not None and self._editor_inst.locks[inf_index]:
                     return self._locked_text
 
                 if value != 0 and value < 0.001:
@@ -271,9 +294,7 @@ class TableModel(abstract_weights_view.AbstractModel):
                 elif value >= 0.999:
                     return self._full_weight_text
             else:
-                if value != 0 and value < 0.001:
-                    return "< 0.001"
-                return "{0:.3f}".format(value)
+                return self.get_display_text(value)
     
     def setData(self, index, value, role):
         """
@@ -292,12 +313,12 @@ class TableModel(abstract_weights_view.AbstractModel):
             return False
 
         if self.input_value is None:
-            if not value.replace(".", "").isdigit():
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
                 return False
             
-            value = float(value)
-            
-            if not (value >= 0 and value <= 1):
+            if not (0.0 <= value <= 1.0):
                 return False
 
             # Skip if the values are the same.
@@ -320,6 +341,31 @@ class TableModel(abstract_weights_view.AbstractModel):
         
         return True
     
+    def apply_input_value(self, indexes):
+        """
+        Sets the value that was entered in the edited cell onto other cells.
+        It was already validated by setData, so this skips straight to distributing the weights.
+
+        Args:
+            indexes(QModelIndex[]): The cells to set.
+        """
+        if self.input_value is None:
+            return
+
+        # Group cells by row so each vertex is only resolved once. {row: [inf, ..]}
+        row_infs = {}
+        for index in indexes:
+            if index.isValid():
+                row_infs.setdefault(index.row(), []).append(self.get_inf(index.column()))
+
+        skin_data = self._editor_inst.obj.skin_data
+
+        for row, infs in row_infs.items():
+            vert_index = self.get_vert_index(row)
+
+            for inf in infs:
+                skin_data.update_weight_value(vert_index, inf, self.input_value)
+
     def headerData(self, column, orientation, role):
         """
         Deterimines the header's labels and style.
@@ -329,9 +375,8 @@ class TableModel(abstract_weights_view.AbstractModel):
             if orientation == QtCore.Qt.Horizontal:
                 inf_name = self.display_infs[column]
                 
-                if inf_name in self._editor_inst.obj.infs:
-                    inf_index = self._editor_inst.obj.infs.index(inf_name)
-                    
+                inf_index = self._editor_inst.obj.inf_indexes.get(inf_name)
+                if inf_index is not None:
                     is_locked = self._editor_inst.locks[inf_index]
                     if is_locked:
                         return self._header_locked_text
@@ -365,10 +410,14 @@ class TableModel(abstract_weights_view.AbstractModel):
                 if self.display_infs and column < len(self.display_infs):
                     return self.display_infs[column]
 
+    def _get_value(self, vert_index, inf):
+        # Goes straight to the data's dict since this runs for every cell that gets drawn.
+        return self._editor_inst.obj.skin_data.data[vert_index]["weights"].get(inf, 0)
+
     def _get_value_by_index(self, index):
         inf = self.get_inf(index.column())
         vert_index = self.get_vert_index(index.row())
-        return self._editor_inst.obj.skin_data[vert_index]["weights"].get(inf) or 0
+        return self._get_value(vert_index, inf)
 
     def get_vert_index(self, row):
         return self._editor_inst.vert_indexes[row]